@@ -1,19 +1,107 @@
 import streamlit as st
-import os
-import sys
+import pandas as pd
+import copy
+import string
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Add core directory to path - use absolute path
-core_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'core')
-if core_path not in sys.path:
-    sys.path.insert(0, core_path)
+from core.env_utils import detect_environment, get_environment_info
+from core.resources import cached_config, get_db_manager
+from core.installer import ensure_dependencies
+from core.ui_helpers import setup_page_config, display_environment_indicator, get_environment_indicator_html, show_notification
 
-from env_utils import detect_environment, get_environment_info
-from config_loader import load_config
-from db_manager import DatabaseManager
-from installer import check_and_install_dependencies
-from ui_helpers import setup_page_config, display_environment_indicator, show_notification
-from login_page import show_login_page, show_user_menu
+# Static Platform Overview KPIs, stored as parallel tuples
+_OVERVIEW_METRICS = ("Active Resources", "Total Cost (Monthly)", "Active Incidents", "Performance Score")
+_OVERVIEW_VALUES = ("127", "$15,432", "3", "94%")
+_OVERVIEW_DELTAS = ("5 this week", "-$1,234 from last month", "-2 from yesterday", "2% improvement")
+
+# Feature overview cards, stored as parallel tuples
+_FEATURE_ICONS = ("🔍", "💰", "🚨", "📈", "🧰", "⚙️")
+_FEATURE_TITLES = (
+    "Resource Explorer",
+    "Cost Dashboard",
+    "Incident Center",
+    "Performance Monitor",
+    "Tools & Utilities",
+    "Admin Settings",
+)
+_FEATURE_DESCS = (
+    "Browse and manage Azure resources across subscriptions",
+    "Monitor and analyze Azure spending patterns",
+    "Track and resolve Azure service incidents",
+    "View Azure Monitor metrics and insights",
+    "Resource management and automation tools",
+    "Configure environment and database settings",
+)
+
+_FOOTER_TMPL = string.Template("""
+        <div style='text-align: center; color: #666; padding: 20px;'>
+            Azure Platform Support Center v1.0 | Environment: $name | 
+            Running on $env
+        </div>
+        """)
+
+@st.cache_data
+def _footer_html(name: str, env: str) -> str:
+    """Footer markup, built once per environment name."""
+    return _FOOTER_TMPL.substitute(name=name, env=env.title())
+
+@st.cache_data(ttl=300)
+def _env_info(environment: str):
+    """Environment details, refreshed every 5 minutes."""
+    return get_environment_info(environment)
+
+def _warm_azure_credential(config):
+    """Build the shared Azure credential ahead of first use when the real client is enabled."""
+    if not config.get('azure', {}).get('use_real_client', False):
+        return None
+    
+    try:
+        from core.azure_auth import AzureAuth
+        auth = AzureAuth(config)
+        return auth.get_credential() if auth.is_configured() else None
+    except Exception as e:
+        # The Azure client retries on first use
+        logging.getLogger(__name__).warning(f"Azure credential warm-up failed: {e}")
+        return None
+
+@st.fragment(run_every=1.0)
+def _clock_metric():
+    """Tick the Last Updated metric without rerunning the whole page."""
+    st.metric("Last Updated", datetime.now().strftime("%H:%M:%S"))
+
+@st.fragment
+def _render_dashboard(env_info, db_type, db_status):
+    """Render the static overview, feature cards and footer independently of main reruns."""
+    # Quick stats dashboard, sent to the frontend as a single table
+    st.subheader("📊 Platform Overview")
+    
+    kpis = pd.DataFrame({
+        'Metric': ("Environment", "Database") + _OVERVIEW_METRICS,
+        'Value': (env_info['name'], db_type) + _OVERVIEW_VALUES,
+        'Delta': (env_info['status'], db_status) + _OVERVIEW_DELTAS,
+    })
+    st.dataframe(kpis, hide_index=True, use_container_width=True)
+    
+    # Feature overview
+    st.markdown("---")
+    st.subheader("🚀 Available Features")
+    
+    cols = st.columns(2)
+    for i, (icon, title, desc) in enumerate(zip(_FEATURE_ICONS, _FEATURE_TITLES, _FEATURE_DESCS)):
+        with cols[i % 2]:
+            with st.container():
+                st.markdown(f"**{icon} {title}**")
+                st.markdown(f"_{desc}_")
+                st.markdown("---")
+    
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        _footer_html(env_info['name'], st.session_state.environment),
+        unsafe_allow_html=True
+    )
 
 def main():
     # Set up page configuration
@@ -25,25 +113,46 @@ def main():
         st.session_state.db_connected = False
         st.session_state.authenticated = False
         st.session_state.environment = detect_environment()
-        st.session_state.config = load_config()
+        st.session_state.config = copy.deepcopy(cached_config())
+    
+    # The indicator markup is fixed for the session; env details come from _env_info's
+    # 5-minute cache on every rerun so they do not go stale
+    if 'env_indicator_html' not in st.session_state:
+        st.session_state.env_indicator_html = get_environment_indicator_html(st.session_state.environment)
+    env_info = _env_info(st.session_state.environment)
     
     # Initialize database first (needed for authentication)
     if not st.session_state.initialized:
+        # Paint a skeleton immediately so the first load is not a blank page
+        shell = st.empty()
+        with shell.container():
+            st.title("🔷 Azure Platform Support Center")
+            st.caption(f"{env_info['name']} environment")
+            for col, label in zip(st.columns(3), ("Environment", "Database", "Last Updated")):
+                col.metric(label, "…")
+        
         with st.spinner("Initializing Azure Platform Support Center..."):
             try:
-                # Check dependencies (skip in Databricks to avoid errors)
-                if st.session_state.environment != 'databricks':
-                    check_and_install_dependencies(st.session_state.environment)
+                # Dependency check and Azure credential warm-up overlap with database init
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    # Check dependencies (skip in Databricks to avoid errors)
+                    f_deps = None
+                    if st.session_state.environment != 'databricks':
+                        f_deps = executor.submit(ensure_dependencies, st.session_state.environment)
+                    f_azure = executor.submit(_warm_azure_credential, st.session_state.config)
+                    
+                    # Initialize the database manager shared by all sessions
+                    db_ready = get_db_manager(st.session_state.config) is not None
+                    
+                    if f_deps:
+                        f_deps.result()
+                    f_azure.result()
                 
-                # Initialize database
-                db_manager = DatabaseManager(st.session_state.config)
-                if db_manager.initialize():
+                if db_ready:
                     st.session_state.db_connected = True
-                    st.session_state.db_manager = db_manager
                 else:
                     # Database failed but continue with limited functionality
                     st.session_state.db_connected = False
-                    st.session_state.db_manager = None
                     st.warning("⚠️ Database connection failed. Running in limited mode without authentication.")
                 
                 st.session_state.initialized = True
@@ -52,13 +161,23 @@ def main():
                 # Log error but don't exit - continue with limited functionality
                 st.session_state.initialized = True
                 st.session_state.db_connected = False
-                st.session_state.db_manager = None
                 st.warning(f"⚠️ Initialization error: {str(e)}. Running in limited mode.")
+        
+        shell.empty()
+    
+    db_manager = get_db_manager(st.session_state.config) if st.session_state.db_connected else None
+    
+    # none: always demo user, optional: login when a database is available, required: login only
+    auth_mode = st.session_state.config.get('app', {}).get('auth_mode', 'optional')
     
     # Check authentication (skip if no database)
     if not st.session_state.get('authenticated', False):
-        if st.session_state.db_manager:
-            show_login_page(st.session_state.db_manager)
+        if db_manager and auth_mode != 'none':
+            from core.login_page import show_login_page
+            show_login_page(db_manager)
+            return
+        elif auth_mode == 'required':
+            st.error("🔒 Authentication is required but the database is unavailable. Please try again later.")
             return
         else:
             # No database - skip authentication for demo mode
@@ -71,8 +190,10 @@ def main():
     
     # Display environment indicator and user menu in sidebar
     with st.sidebar:
-        display_environment_indicator(st.session_state.environment)
-        show_user_menu()
+        display_environment_indicator(st.session_state.environment, st.session_state.env_indicator_html)
+        if auth_mode != 'none':
+            from core.login_page import show_user_menu
+            show_user_menu()
         
         # Navigation
         st.markdown("---")
@@ -82,91 +203,18 @@ def main():
     # Main content area
     st.title("🔷 Azure Platform Support Center")
     
-    # Environment information
-    env_info = get_environment_info(st.session_state.environment)
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Environment", env_info['name'], env_info['status'])
-    with col2:
-        db_type = "None"
-        db_status = "Disconnected"
-        if st.session_state.db_connected and st.session_state.db_manager:
-            db_type = st.session_state.db_manager.db_type.upper() if st.session_state.db_manager.db_type else "Unknown"
-            db_status = "Connected"
-        st.metric("Database", db_type, db_status)
-    with col3:
-        st.metric("Last Updated", datetime.now().strftime("%H:%M:%S"))
+    db_type = "None"
+    db_status = "Disconnected"
+    if db_manager:
+        db_type = db_manager.db_type.upper() if db_manager.db_type else "Unknown"
+        db_status = "Connected"
     
+    _clock_metric()
     
     # Main dashboard content
     st.markdown("---")
     
-    # Quick stats dashboard
-    st.subheader("📊 Platform Overview")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="Active Resources",
-            value="127",
-            delta="5 this week"
-        )
-    
-    with col2:
-        st.metric(
-            label="Total Cost (Monthly)",
-            value="$15,432",
-            delta="-$1,234 from last month"
-        )
-    
-    with col3:
-        st.metric(
-            label="Active Incidents",
-            value="3",
-            delta="-2 from yesterday"
-        )
-    
-    with col4:
-        st.metric(
-            label="Performance Score",
-            value="94%",
-            delta="2% improvement"
-        )
-    
-    # Feature overview
-    st.markdown("---")
-    st.subheader("🚀 Available Features")
-    
-    features = [
-        {"icon": "🔍", "title": "Resource Explorer", "desc": "Browse and manage Azure resources across subscriptions"},
-        {"icon": "💰", "title": "Cost Dashboard", "desc": "Monitor and analyze Azure spending patterns"},
-        {"icon": "🚨", "title": "Incident Center", "desc": "Track and resolve Azure service incidents"},
-        {"icon": "📈", "title": "Performance Monitor", "desc": "View Azure Monitor metrics and insights"},
-        {"icon": "🧰", "title": "Tools & Utilities", "desc": "Resource management and automation tools"},
-        {"icon": "⚙️", "title": "Admin Settings", "desc": "Configure environment and database settings"},
-    ]
-    
-    cols = st.columns(2)
-    for i, feature in enumerate(features):
-        with cols[i % 2]:
-            with st.container():
-                st.markdown(f"**{feature['icon']} {feature['title']}**")
-                st.markdown(f"_{feature['desc']}_")
-                st.markdown("---")
-    
-    # Footer
-    st.markdown("---")
-    st.markdown(
-        f"""
-        <div style='text-align: center; color: #666; padding: 20px;'>
-            Azure Platform Support Center v1.0 | Environment: {env_info['name']} | 
-            Running on {st.session_state.environment.title()}
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    _render_dashboard(env_info, db_type, db_status)
 
 if __name__ == "__main__":
     main()
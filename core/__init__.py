@@ -0,0 +1,3 @@
+"""
+Core services for the Azure Platform Support app.
+"""
@@ -0,0 +1,103 @@
+"""
+Client-side load balancing for Azure Resource Manager requests.
+Spreads ARM traffic over several independent connections so throttling is not
+concentrated on a single ARM front-end instance.
+"""
+
+import itertools
+import logging
+import threading
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.pipeline.transport import HttpTransport, RequestsTransport
+
+# Response header carrying the remaining read quota on the serving ARM instance
+RATELIMIT_READS_HEADER = 'x-ms-ratelimit-remaining-subscription-reads'
+
+def _new_transport(pool_maxsize: int) -> RequestsTransport:
+    """Create a transport backed by its own session and connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
+class ArmBalancerTransport(HttpTransport):
+    """
+    HTTP transport that round-robins requests over a pool of independent sessions.
+
+    ARM throttles per front-end instance, and a keep-alive connection stays pinned
+    to the instance that accepted it. Each session holds its own connections, so
+    requests fan out across instances. When a response reports that the remaining
+    read quota on its instance has dropped below the recycle threshold, that
+    session is replaced so its next connection lands on a different instance.
+    """
+
+    def __init__(self, pool_size: int = 8, recycle_threshold: int = 100, pool_maxsize: int = 10):
+        self.pool_size = max(1, pool_size)
+        self.recycle_threshold = recycle_threshold
+        self.pool_maxsize = pool_maxsize
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._transports: List[RequestsTransport] = [_new_transport(pool_maxsize) for _ in range(self.pool_size)]
+        self._next = itertools.cycle(range(self.pool_size))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        for transport in self._transports:
+            transport.open()
+
+    def close(self):
+        with self._lock:
+            for transport in self._transports:
+                transport.close()
+
+    def send(self, request, **kwargs):
+        """
+        Send a request on the next session in the pool.
+
+        Args:
+            request: azure.core HttpRequest
+
+        Returns:
+            azure.core HttpResponse
+        """
+        with self._lock:
+            slot = next(self._next)
+            transport = self._transports[slot]
+
+        response = transport.send(request, **kwargs)
+
+        remaining = self._remaining_reads(response)
+        if remaining is not None and remaining < self.recycle_threshold:
+            self._recycle(slot, transport, remaining)
+
+        return response
+
+    @staticmethod
+    def _remaining_reads(response) -> Optional[int]:
+        """Remaining read quota reported by ARM, if present."""
+        value = response.headers.get(RATELIMIT_READS_HEADER)
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def _recycle(self, slot: int, transport: RequestsTransport, remaining: int):
+        """Replace a session whose ARM instance is close to its read quota."""
+        with self._lock:
+            # Another thread may already have replaced it
+            if self._transports[slot] is not transport:
+                return
+            self._transports[slot] = _new_transport(self.pool_maxsize)
+
+        # The old session is dropped rather than closed so responses still streaming
+        # from it are unaffected; its connections close when it is garbage collected
+        self.logger.info(f"Recycling ARM connection {slot} ({remaining} reads remaining)")
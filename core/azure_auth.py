@@ -4,11 +4,124 @@ Handles Azure authentication using DefaultAzureCredential with fallback options.
 """
 
 import os
+import time
 import logging
-from typing import Optional, Dict, Any
-from azure.identity import DefaultAzureCredential, ClientSecretCredential, ManagedIdentityCredential
+import functools
+import threading
+from typing import Optional, Dict, Any, Tuple
 from azure.core.credentials import AccessToken
 
+MANAGEMENT_SCOPE = "https://management.azure.com/.default"
+
+# Seconds before expiry at which a cached token is refreshed
+_TOKEN_REFRESH_MARGIN = 300
+
+class SharedTokenCredential:
+    """
+    Credential wrapper that caches access tokens per scope for every SDK client.
+    
+    Each SDK client keeps its own bearer token policy, so without a shared
+    cache a burst of new clients triggers one token request each. Tokens are
+    refreshed ahead of expiry; requests carrying claims or a tenant override
+    always go to the wrapped credential.
+    """
+    
+    def __init__(self, credential):
+        self.credential = credential
+        self._tokens: Dict[Tuple[str, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+    
+    def get_token(self, *scopes: str, claims: Optional[str] = None,
+                  tenant_id: Optional[str] = None, **kwargs) -> AccessToken:
+        if claims or tenant_id:
+            return self.credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+        
+        token = self._tokens.get(scopes)
+        if token and token.expires_on - _TOKEN_REFRESH_MARGIN > time.time():
+            return token
+        
+        with self._lock:
+            # Another thread may have refreshed it while we waited
+            token = self._tokens.get(scopes)
+            if not token or token.expires_on - _TOKEN_REFRESH_MARGIN <= time.time():
+                token = self.credential.get_token(*scopes, **kwargs)
+                self._tokens[scopes] = token
+            return token
+    
+    def close(self):
+        close = getattr(self.credential, 'close', None)
+        if close:
+            close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+@functools.lru_cache(maxsize=8)
+def _build_credential(tenant_id: Optional[str], client_id: Optional[str],
+                      client_secret: Optional[str], use_managed_identity: bool,
+                      managed_identity_client_id: Optional[str]) -> SharedTokenCredential:
+    """
+    Get the shared, token-caching credential for a configuration signature.
+    
+    Cached process-wide; exceptions are not cached, so a failed attempt is
+    retried on the next call.
+    """
+    return SharedTokenCredential(_create_credential(
+        tenant_id, client_id, client_secret, use_managed_identity, managed_identity_client_id
+    ))
+
+def _create_credential(tenant_id: Optional[str], client_id: Optional[str],
+                      client_secret: Optional[str], use_managed_identity: bool,
+                      managed_identity_client_id: Optional[str]):
+    """
+    Create an Azure credential for the given configuration signature.
+    
+    azure.identity is imported per branch to keep it off the application's
+    import path until Azure auth is actually used.
+    """
+    logger = logging.getLogger(__name__)
+    
+    # Option 1: Service Principal (explicit credentials)
+    if tenant_id and client_id and client_secret:
+        try:
+            logger.info("Using Service Principal authentication")
+            from azure.identity import ClientSecretCredential
+            return ClientSecretCredential(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                client_secret=client_secret
+            )
+        except Exception as e:
+            logger.error(f"Service Principal authentication failed: {e}")
+    
+    # Option 2: Managed Identity (for Azure-hosted resources)
+    if use_managed_identity:
+        try:
+            logger.info("Using Managed Identity authentication")
+            from azure.identity import ManagedIdentityCredential
+            return ManagedIdentityCredential(client_id=managed_identity_client_id)
+        except Exception as e:
+            logger.error(f"Managed Identity authentication failed: {e}")
+    
+    # Option 3: DefaultAzureCredential (tries multiple methods)
+    try:
+        logger.info("Using DefaultAzureCredential authentication")
+        # DefaultAzureCredential tries these in order:
+        # 1. EnvironmentCredential
+        # 2. ManagedIdentityCredential
+        # 3. SharedTokenCacheCredential
+        # 4. VisualStudioCodeCredential
+        # 5. AzureCliCredential
+        # 6. AzurePowerShellCredential
+        from azure.identity import DefaultAzureCredential
+        return DefaultAzureCredential()
+    except Exception as e:
+        logger.error(f"DefaultAzureCredential failed: {e}")
+        raise Exception("Failed to authenticate with Azure. Please configure credentials.")
+
 class AzureAuth:
     """
     Azure authentication manager supporting multiple authentication methods:
@@ -22,57 +135,37 @@ class AzureAuth:
         self.credential = None
         self.logger = logging.getLogger(__name__)
         
+        # Parse the auth section once; is_configured and get_credential reuse it
+        self._auth = self.config.get('azure_auth', {})
+        self._has_sp = {'tenant_id', 'client_id', 'client_secret'}.issubset(self._auth)
+        self._has_mi = bool(self._auth.get('use_managed_identity', False))
+        self._has_env = bool(os.environ.get('AZURE_CLIENT_ID') or os.environ.get('AZURE_TENANT_ID'))
+        
     def get_credential(self):
         """
         Get Azure credential for authentication.
         
+        Credentials are shared process-wide per configuration, so new
+        AzureAuth instances do not repeat the credential chain discovery.
+        
         Returns:
             Azure credential object
         """
         if self.credential:
             return self.credential
         
-        # Try to get credentials from config or environment
-        auth_config = self.config.get('azure_auth', {})
-        
-        # Option 1: Service Principal (explicit credentials)
-        if all(key in auth_config for key in ['tenant_id', 'client_id', 'client_secret']):
-            try:
-                self.logger.info("Using Service Principal authentication")
-                self.credential = ClientSecretCredential(
-                    tenant_id=auth_config['tenant_id'],
-                    client_id=auth_config['client_id'],
-                    client_secret=auth_config['client_secret']
-                )
-                return self.credential
-            except Exception as e:
-                self.logger.error(f"Service Principal authentication failed: {e}")
-        
-        # Option 2: Managed Identity (for Azure-hosted resources)
-        if auth_config.get('use_managed_identity', False):
-            try:
-                self.logger.info("Using Managed Identity authentication")
-                client_id = auth_config.get('managed_identity_client_id')
-                self.credential = ManagedIdentityCredential(client_id=client_id)
-                return self.credential
-            except Exception as e:
-                self.logger.error(f"Managed Identity authentication failed: {e}")
-        
-        # Option 3: DefaultAzureCredential (tries multiple methods)
-        try:
-            self.logger.info("Using DefaultAzureCredential authentication")
-            # DefaultAzureCredential tries these in order:
-            # 1. EnvironmentCredential
-            # 2. ManagedIdentityCredential
-            # 3. SharedTokenCacheCredential
-            # 4. VisualStudioCodeCredential
-            # 5. AzureCliCredential
-            # 6. AzurePowerShellCredential
-            self.credential = DefaultAzureCredential()
-            return self.credential
-        except Exception as e:
-            self.logger.error(f"DefaultAzureCredential failed: {e}")
-            raise Exception("Failed to authenticate with Azure. Please configure credentials.")
+        self.credential = _build_credential(*self._credential_key())
+        return self.credential
+    
+    def _credential_key(self) -> Tuple[Optional[str], ...]:
+        """Build the hashable signature used to look up the shared credential."""
+        return (
+            self._auth.get('tenant_id'),
+            self._auth.get('client_id'),
+            self._auth.get('client_secret'),
+            self._has_mi,
+            self._auth.get('managed_identity_client_id')
+        )
     
     def test_authentication(self) -> Dict[str, Any]:
         """
@@ -85,13 +178,13 @@ class AzureAuth:
             credential = self.get_credential()
             
             # Try to get a token to verify authentication works
-            # Using management scope as a test
-            token = credential.get_token("https://management.azure.com/.default")
+            # Using management scope as a test (served from the shared cache while valid)
+            token = credential.get_token(MANAGEMENT_SCOPE)
             
             return {
                 'authenticated': True,
                 'message': 'Successfully authenticated with Azure',
-                'credential_type': type(credential).__name__,
+                'credential_type': type(credential.credential).__name__,
                 'token_expires': token.expires_on if hasattr(token, 'expires_on') else None
             }
         except Exception as e:
@@ -103,15 +196,16 @@ class AzureAuth:
                 'credential_type': None
             }
     
-    def get_subscription_id(self) -> Optional[str]:
+    @functools.cached_property
+    def subscription_id(self) -> Optional[str]:
         """
-        Get Azure subscription ID from config or environment.
+        Azure subscription ID from config or environment, resolved once per instance.
         
         Returns:
             Subscription ID string or None
         """
         # Try config first
-        sub_id = self.config.get('azure_auth', {}).get('subscription_id')
+        sub_id = self._auth.get('subscription_id')
         
         # Try environment variables
         if not sub_id:
@@ -119,6 +213,10 @@ class AzureAuth:
         
         return sub_id
     
+    def invalidate_subscription_id(self):
+        """Drop the cached subscription ID so it is re-read on next access."""
+        self.__dict__.pop('subscription_id', None)
+    
     def is_configured(self) -> bool:
         """
         Check if Azure authentication is configured.
@@ -126,18 +224,5 @@ class AzureAuth:
         Returns:
             True if configured, False otherwise
         """
-        auth_config = self.config.get('azure_auth', {})
-        
-        # Check if we have explicit credentials
-        if all(key in auth_config for key in ['tenant_id', 'client_id', 'client_secret']):
-            return True
-        
-        # Check if managed identity is enabled
-        if auth_config.get('use_managed_identity', False):
-            return True
-        
-        # Check if Azure CLI is configured (for DefaultAzureCredential)
-        if os.environ.get('AZURE_CLIENT_ID') or os.environ.get('AZURE_TENANT_ID'):
-            return True
-        
-        return False
+        # Explicit credentials, managed identity, or environment (for DefaultAzureCredential)
+        return self._has_sp or self._has_mi or self._has_env
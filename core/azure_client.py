@@ -4,60 +4,336 @@ This simulates Azure SDK functionality for development and testing.
 Replace with real Azure SDK calls in production.
 """
 
-import random
 import json
+import time
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+# Optional JIT for the metric generator; the NumPy path is used without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fixed share of total spend attributed to each service and resource group
+_SERVICE_COST_NAMES = ('Virtual Machines', 'Storage', 'App Services', 'SQL Database', 'Networking', 'Other')
+_SERVICE_COST_SHARES = np.array([0.4, 0.18, 0.22, 0.12, 0.06, 0.02])
+_RG_COST_NAMES = ('rg-production', 'rg-development', 'rg-staging', 'rg-shared', 'rg-backup')
+_RG_COST_SHARES = np.array([0.55, 0.21, 0.12, 0.08, 0.04])
+
+# Metric generator parameters: (base, sigma, amplitude, period, lower bound, upper bound)
+_CPU_PARAMS = (65, 15, 10, 288, 0, 100)  # CPU usage typically 0-100%
+_MEMORY_PARAMS = (70, 10, 5, 288, 0, 100)  # Memory usage typically 0-100%
+_RESPONSE_TIME_PARAMS = (250, 50, 20, 144, 50, None)  # Response time in milliseconds
+_REQUESTS_PARAMS = (1200, 200, 400, 288, 0, None)  # Request count per minute
+_DEFAULT_METRIC_PARAMS = (50, 10, 0, 1, None, None)  # Generic metric
+
+_METRIC_PARAMS = {
+    'cpu': _CPU_PARAMS,
+    'cpu_usage': _CPU_PARAMS,
+    'processor_time': _CPU_PARAMS,
+    'memory': _MEMORY_PARAMS,
+    'memory_usage': _MEMORY_PARAMS,
+    'available_memory': _MEMORY_PARAMS,
+    'response_time': _RESPONSE_TIME_PARAMS,
+    'latency': _RESPONSE_TIME_PARAMS,
+    'requests': _REQUESTS_PARAMS,
+    'request_count': _REQUESTS_PARAMS
+}
+
+_METRIC_UNITS = MappingProxyType({
+    'cpu': 'Percent',
+    'cpu_usage': 'Percent',
+    'processor_time': 'Percent',
+    'memory': 'Percent',
+    'memory_usage': 'Percent',
+    'available_memory': 'Bytes',
+    'response_time': 'Milliseconds',
+    'latency': 'Milliseconds',
+    'requests': 'Count',
+    'request_count': 'Count/Minute',
+    'disk_io': 'Bytes/Second',
+    'network_in': 'Bytes/Second',
+    'network_out': 'Bytes/Second'
+})
+
+# Services reported by get_service_health and the issues attached to unhealthy ones
+_HEALTH_SERVICES = (
+    'Virtual Machines',
+    'Storage Accounts',
+    'App Services',
+    'SQL Database',
+    'Key Vault',
+    'Container Instances',
+    'Kubernetes Service',
+    'Function Apps'
+)
+
+_HEALTH_STATUSES = np.array(['Healthy', 'Warning', 'Critical', 'Unknown'])
+
+_HEALTH_ISSUES = (
+    'High latency detected',
+    'Intermittent connectivity issues',
+    'Elevated error rates',
+    'Resource capacity constraints',
+    'Performance degradation'
+)
+
+# Static Azure Advisor recommendations, read-only
+_RECOMMENDATIONS = tuple(MappingProxyType(rec) for rec in [
+    {
+        'category': 'Cost',
+        'title': 'Right-size underutilized virtual machines',
+        'description': 'Your virtual machines are underutilized. Consider resizing to a smaller SKU.',
+        'potential_savings': '$1,200/month',
+        'affected_resources': 12,
+        'priority': 'High',
+        'effort': 'Low'
+    },
+    {
+        'category': 'Performance', 
+        'title': 'Enable Accelerated Networking',
+        'description': 'Improve network performance by enabling accelerated networking.',
+        'potential_savings': 'Performance improvement',
+        'affected_resources': 8,
+        'priority': 'Medium',
+        'effort': 'Low'
+    },
+    {
+        'category': 'Security',
+        'title': 'Enable Azure Security Center recommendations',
+        'description': 'Apply security recommendations to improve your security posture.',
+        'potential_savings': 'Security improvement',
+        'affected_resources': 15,
+        'priority': 'High', 
+        'effort': 'Medium'
+    },
+    {
+        'category': 'Reliability',
+        'title': 'Configure backup for virtual machines',
+        'description': 'Protect your virtual machines by configuring backup.',
+        'potential_savings': 'Reliability improvement',
+        'affected_resources': 6,
+        'priority': 'Medium',
+        'effort': 'Low'
+    }
+])
+
+# Zero-padded resource suffixes and names are identical on every generation
+_RESOURCE_COUNT = 50
+_RESOURCE_SUFFIXES = tuple(f'{i:03d}' for i in range(_RESOURCE_COUNT))
+_RESOURCE_NAMES = tuple('resource-' + suffix for suffix in _RESOURCE_SUFFIXES)
+
+if NUMBA_AVAILABLE:
+    # fastmath without 'nnan'/'ninf': unbounded metrics clamp against +/-inf
+    @njit(fastmath={'contract', 'afn', 'reassoc', 'arcp', 'nsz'}, cache=True)
+    def _gen_metric_kernel(noise, base, sigma, amp, period, lo, hi):
+        """Fuse scale, sine and clip into one loop, writing the series over `noise`."""
+        step = 2.0 * np.pi / period
+        for i in range(noise.shape[0]):
+            value = base + sigma * noise[i] + amp * np.sin(step * i)
+            noise[i] = min(hi, max(lo, value))
+        return noise
+
 class AzureClient:
     """
     Mock Azure client that simulates Azure SDK functionality.
     Provides realistic sample data for development and testing.
     """
     
+    # Seconds a generated resource set is served before regenerating
+    RESOURCE_CACHE_TTL = 300
+    
+    # Sample data pools, shared by all instances and immutable
+    subscriptions = (
+        "Production Subscription",
+        "Development Subscription", 
+        "Staging Subscription"
+    )
+    
+    resource_groups = (
+        "rg-production",
+        "rg-development", 
+        "rg-staging",
+        "rg-shared",
+        "rg-backup"
+    )
+    
+    regions = (
+        "East US",
+        "West US 2", 
+        "North Europe",
+        "Southeast Asia",
+        "UK South"
+    )
+    
+    resource_types = (
+        "Virtual Machines",
+        "Storage Accounts",
+        "App Services", 
+        "SQL Databases",
+        "Key Vaults",
+        "Function Apps",
+        "Container Instances",
+        "Kubernetes Services"
+    )
+    
+    # Batched random sampling draws from NumPy arrays of the categorical pools
+    _rg_arr = np.array(resource_groups)
+    _type_arr = np.array(resource_types)
+    _region_arr = np.array(regions)
+    _status_arr = np.array(['Running', 'Stopped', 'Starting', 'Deallocated'])
+    _env_arr = np.array(['prod', 'dev', 'staging'])
+    _owner_arr = np.array(['team-a', 'team-b', 'team-c'])
+    
     def __init__(self):
-        self.subscriptions = [
-            "Production Subscription",
-            "Development Subscription", 
-            "Staging Subscription"
-        ]
-        
-        self.resource_groups = [
-            "rg-production",
-            "rg-development", 
-            "rg-staging",
-            "rg-shared",
-            "rg-backup"
-        ]
-        
-        self.regions = [
-            "East US",
-            "West US 2", 
-            "North Europe",
-            "Southeast Asia",
-            "UK South"
-        ]
-        
-        self.resource_types = [
-            "Virtual Machines",
-            "Storage Accounts",
-            "App Services", 
-            "SQL Databases",
-            "Key Vaults",
-            "Function Apps",
-            "Container Instances",
-            "Kubernetes Services"
-        ]
+        self._local = threading.local()
+        
+        # Generated resource set, reused for RESOURCE_CACHE_TTL seconds
+        self._resources_cache: Optional[pd.DataFrame] = None
+        self._resources_cache_ts: float = 0
+        
+        # Filtered views of the cached resource set, keyed on (resource_group, resource_type, region)
+        self._filter_cache: Dict[Tuple[Optional[str], ...], pd.DataFrame] = {}
+        self._cache_lock = threading.RLock()
     
     def get_subscriptions(self) -> List[str]:
         """Get list of available Azure subscriptions."""
-        return self.subscriptions
+        return list(self.subscriptions)
     
     def get_resource_groups(self, subscription_id: Optional[str] = None) -> List[str]:
         """Get list of resource groups for a subscription."""
-        return self.resource_groups
+        return list(self.resource_groups)
+    
+    def _resources_df(self) -> pd.DataFrame:
+        """
+        Generate the sample resource set in columnar form.
+        
+        Returns:
+            DataFrame with one row per resource; categorical columns use pd.Categorical
+        """
+        n = _RESOURCE_COUNT
+        rng = self._rng
+        
+        def pick(pool: np.ndarray) -> pd.Categorical:
+            return pd.Categorical.from_codes(rng.integers(0, len(pool), n), categories=pool)
+        
+        # Generate sample resources one column at a time
+        rgs = pick(self._rg_arr)
+        ages = rng.integers(1, 366, n).tolist()
+        now = datetime.now()
+        
+        return pd.DataFrame({
+            'id': ['/subscriptions/sub-' + suffix + '/resourceGroups/' + rg +
+                   '/providers/Microsoft.Compute/resource-' + suffix
+                   for suffix, rg in zip(_RESOURCE_SUFFIXES, rgs)],
+            'name': _RESOURCE_NAMES,
+            'type': pick(self._type_arr),
+            'resource_group': rgs,
+            'region': pick(self._region_arr),
+            'status': pick(self._status_arr),
+            'env': pick(self._env_arr),
+            'cost_center': rng.integers(1000, 10000, n),
+            'owner': pick(self._owner_arr),
+            'created_date': [(now - timedelta(days=age)).isoformat() for age in ages],
+            'monthly_cost': rng.integers(50, 2001, n)
+        })
+    
+    @property
+    def _rng(self) -> np.random.Generator:
+        """Per-thread random generator, so concurrent sessions never share RNG state."""
+        rng = getattr(self._local, 'rng', None)
+        if rng is None:
+            rng = self._local.rng = np.random.default_rng()
+        return rng
+    
+    def _cached_resources_df(self) -> pd.DataFrame:
+        """Return the generated resource set, regenerating it once the TTL expires."""
+        with self._cache_lock:
+            if (self._resources_cache is None or
+                    time.time() - self._resources_cache_ts >= self.RESOURCE_CACHE_TTL):
+                self._resources_cache = self._resources_df()
+                self._resources_cache_ts = time.time()
+                self._filter_cache.clear()
+            return self._resources_cache
+    
+    def _filtered_resources_df(self, resource_group: Optional[str] = None,
+                               resource_type: Optional[str] = None,
+                               region: Optional[str] = None) -> pd.DataFrame:
+        """Return the cached resource set filtered, memoizing each filter combination."""
+        # None and "All" both mean no filter
+        key = tuple(value if value and value != "All" else None
+                    for value in (resource_group, resource_type, region))
+        
+        with self._cache_lock:
+            df = self._cached_resources_df()
+            filtered = self._filter_cache.get(key)
+            if filtered is None:
+                filtered = self._filter_cache[key] = self._filter_resources(df, *key)
+            return filtered
+    
+    def invalidate_cache(self):
+        """Drop the cached resource set so the next call regenerates it."""
+        with self._cache_lock:
+            self._resources_cache = None
+            self._resources_cache_ts = 0
+            self._filter_cache.clear()
+    
+    @staticmethod
+    def _filter_resources(df: pd.DataFrame, resource_group: Optional[str] = None,
+                          resource_type: Optional[str] = None,
+                          region: Optional[str] = None) -> pd.DataFrame:
+        """
+        Apply the optional resource filters as a single boolean mask.
+        
+        Filter values are resolved to category codes first, so each predicate
+        is an integer comparison and an unknown value short-circuits to no rows.
+        """
+        mask = np.ones(len(df), dtype=bool)
+        
+        for column, value in (('resource_group', resource_group), ('type', resource_type), ('region', region)):
+            if not value or value == "All":
+                continue
+            
+            categories = df[column].cat.categories
+            if value not in categories:
+                return df.iloc[:0]
+            
+            mask &= df[column].cat.codes.to_numpy() == categories.get_loc(value)
+        
+        return df.loc[mask]
+    
+    @staticmethod
+    def _resource_records(df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+        """Lazily materialize resource rows as the nested dictionaries returned by the API."""
+        return (
+            {
+                'id': rid,
+                'name': name,
+                'type': rtype,
+                'resource_group': rg,
+                'region': region,
+                'status': status,
+                'tags': {
+                    'environment': env,
+                    'cost-center': f'cc-{cc}',
+                    'owner': owner
+                },
+                'created_date': created,
+                'monthly_cost': cost
+            }
+            for rid, name, rtype, rg, region, status, env, cc, owner, created, cost in zip(
+                df['id'].tolist(), df['name'].tolist(), df['type'].tolist(),
+                df['resource_group'].tolist(), df['region'].tolist(), df['status'].tolist(),
+                df['env'].tolist(), df['cost_center'].tolist(), df['owner'].tolist(),
+                df['created_date'].tolist(), df['monthly_cost'].tolist()
+            )
+        )
     
     def get_resources(self, resource_group: Optional[str] = None, 
                      resource_type: Optional[str] = None,
@@ -73,38 +349,43 @@ class AzureClient:
         Returns:
             List of resource dictionaries
         """
-        resources = []
-        
-        # Generate sample resources
-        for i in range(50):
-            resource = {
-                'id': f'/subscriptions/sub-{i:03d}/resourceGroups/{random.choice(self.resource_groups)}/providers/Microsoft.Compute/resource-{i:03d}',
-                'name': f'resource-{i:03d}',
-                'type': random.choice(self.resource_types),
-                'resource_group': random.choice(self.resource_groups),
-                'region': random.choice(self.regions),
-                'status': random.choice(['Running', 'Stopped', 'Starting', 'Deallocated']),
-                'tags': {
-                    'environment': random.choice(['prod', 'dev', 'staging']),
-                    'cost-center': f'cc-{random.randint(1000, 9999)}',
-                    'owner': random.choice(['team-a', 'team-b', 'team-c'])
-                },
-                'created_date': (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat(),
-                'monthly_cost': random.randint(50, 2000)
-            }
-            resources.append(resource)
-        
-        # Apply filters
-        if resource_group and resource_group != "All":
-            resources = [r for r in resources if r['resource_group'] == resource_group]
+        return list(self.iter_resources(resource_group, resource_type, region))
+    
+    def get_resources_df(self, resource_group: Optional[str] = None,
+                         resource_type: Optional[str] = None,
+                         region: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get Azure resources as a DataFrame with the same columns as the resource dictionaries.
         
-        if resource_type and resource_type != "All":
-            resources = [r for r in resources if r['type'] == resource_type]
+        Args:
+            resource_group: Filter by resource group
+            resource_type: Filter by resource type
+            region: Filter by region
+            
+        Returns:
+            DataFrame with one row per resource
+        """
+        return pd.DataFrame(list(self.iter_resources(resource_group, resource_type, region)))
+    
+    def iter_resources(self, resource_group: Optional[str] = None,
+                       resource_type: Optional[str] = None,
+                       region: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over Azure resources with optional filtering.
         
-        if region and region != "All":
-            resources = [r for r in resources if r['region'] == region]
+        Filters are applied before any row is materialized, and dictionaries
+        are built one at a time as the caller consumes them.
         
-        return resources
+        Args:
+            resource_group: Filter by resource group
+            resource_type: Filter by resource type
+            region: Filter by region
+            
+        Returns:
+            Iterator of resource dictionaries
+        """
+        df = self._filtered_resources_df(resource_group, resource_type, region)
+        return self._resource_records(df)
     
     def get_cost_data(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -116,45 +397,27 @@ class AzureClient:
         Returns:
             Dictionary with cost data and trends
         """
-        dates = pd.date_range(
-            start=datetime.now() - timedelta(days=days),
-            end=datetime.now(),
-            freq='D'
-        )
+        # One entry per day from `days` ago through today
+        today = np.datetime64(datetime.now().date(), 'D')
+        dates = today - np.arange(days, -1, -1)
         
         # Generate realistic cost data with some trends
         base_cost = 500
-        daily_costs = []
+        i = np.arange(len(dates))
+        seasonal = 50 * np.sin(2 * np.pi * i / 7)  # Weekly pattern
+        trend = i * 2  # Slight upward trend
+        noise = self._rng.normal(0, 50, len(dates))  # Random variation
         
-        for i, date in enumerate(dates):
-            # Add some seasonality and trends
-            seasonal = 50 * np.sin(2 * np.pi * i / 7)  # Weekly pattern
-            trend = i * 2  # Slight upward trend
-            noise = np.random.normal(0, 50)  # Random variation
-            
-            daily_cost = max(100, base_cost + seasonal + trend + noise)
-            daily_costs.append(daily_cost)
+        daily_costs = np.maximum(100, base_cost + seasonal + trend + noise)
+        total_cost = float(daily_costs.sum())
         
         return {
-            'dates': [d.strftime('%Y-%m-%d') for d in dates],
-            'daily_costs': daily_costs,
-            'total_cost': sum(daily_costs),
-            'average_daily_cost': np.mean(daily_costs),
-            'cost_by_service': {
-                'Virtual Machines': sum(daily_costs) * 0.4,
-                'Storage': sum(daily_costs) * 0.18,
-                'App Services': sum(daily_costs) * 0.22,
-                'SQL Database': sum(daily_costs) * 0.12,
-                'Networking': sum(daily_costs) * 0.06,
-                'Other': sum(daily_costs) * 0.02
-            },
-            'cost_by_resource_group': {
-                'rg-production': sum(daily_costs) * 0.55,
-                'rg-development': sum(daily_costs) * 0.21,
-                'rg-staging': sum(daily_costs) * 0.12,
-                'rg-shared': sum(daily_costs) * 0.08,
-                'rg-backup': sum(daily_costs) * 0.04
-            }
+            'dates': dates.astype(str).tolist(),
+            'daily_costs': daily_costs.tolist(),
+            'total_cost': total_cost,
+            'average_daily_cost': float(daily_costs.mean()),
+            'cost_by_service': dict(zip(_SERVICE_COST_NAMES, (total_cost * _SERVICE_COST_SHARES).tolist())),
+            'cost_by_resource_group': dict(zip(_RG_COST_NAMES, (total_cost * _RG_COST_SHARES).tolist()))
         }
     
     def get_performance_metrics(self, resource_id: str, 
@@ -171,117 +434,94 @@ class AzureClient:
         Returns:
             Dictionary with metric data points
         """
-        timestamps = pd.date_range(
-            start=datetime.now() - timedelta(hours=hours),
-            end=datetime.now(),
-            freq='5T'  # 5-minute intervals
-        )
+        # 5-minute intervals ending now
+        now = np.datetime64(datetime.now(), 's')
+        timestamps = now - np.arange(hours * 12, -1, -1) * np.timedelta64(5, 'm')
         
         # Generate realistic metric data based on metric type
-        if metric_name.lower() in ['cpu', 'cpu_usage', 'processor_time']:
-            # CPU usage typically 0-100%
-            base = 65
-            values = [max(0, min(100, base + np.random.normal(0, 15) + 10 * np.sin(2 * np.pi * i / 288))) 
-                     for i in range(len(timestamps))]
-        
-        elif metric_name.lower() in ['memory', 'memory_usage', 'available_memory']:
-            # Memory usage typically 0-100%
-            base = 70
-            values = [max(0, min(100, base + np.random.normal(0, 10) + 5 * np.sin(2 * np.pi * i / 288))) 
-                     for i in range(len(timestamps))]
-        
-        elif metric_name.lower() in ['response_time', 'latency']:
-            # Response time in milliseconds
-            base = 250
-            values = [max(50, base + np.random.normal(0, 50) + 20 * np.sin(2 * np.pi * i / 144)) 
-                     for i in range(len(timestamps))]
-        
-        elif metric_name.lower() in ['requests', 'request_count']:
-            # Request count per minute
-            base = 1200
-            values = [max(0, base + np.random.normal(0, 200) + 400 * np.sin(2 * np.pi * i / 288)) 
-                     for i in range(len(timestamps))]
-        
-        else:
-            # Generic metric
-            base = 50
-            values = [base + np.random.normal(0, 10) for _ in range(len(timestamps))]
+        params = _METRIC_PARAMS.get(metric_name.lower(), _DEFAULT_METRIC_PARAMS)
+        values = self._gen_metric(len(timestamps), *params)
         
         return {
             'resource_id': resource_id,
             'metric_name': metric_name,
-            'timestamps': [t.isoformat() for t in timestamps],
-            'values': values,
+            'timestamps': timestamps.astype(str).tolist(),
+            'values': values.tolist(),
             'unit': self._get_metric_unit(metric_name),
             'aggregation': 'Average'
         }
     
+    def _gen_metric(self, n: int, base: float, sigma: float, amp: float, period: float,
+                    lo: Optional[float] = None, hi: Optional[float] = None) -> np.ndarray:
+        """
+        Generate a noisy sinusoidal metric series in one vectorized pass.
+        
+        Args:
+            n: Number of samples
+            base: Mean value
+            sigma: Standard deviation of the noise
+            amp: Amplitude of the periodic component
+            period: Period of the sine wave in samples
+            lo: Optional lower bound
+            hi: Optional upper bound
+            
+        Returns:
+            Array of metric values
+        """
+        if NUMBA_AVAILABLE:
+            return _gen_metric_kernel(
+                self._rng.standard_normal(n), float(base), float(sigma), float(amp), float(period),
+                -np.inf if lo is None else float(lo), np.inf if hi is None else float(hi)
+            )
+        
+        i = np.arange(n)
+        values = base + self._rng.normal(0, sigma, n) + amp * np.sin(2 * np.pi * i / period)
+        
+        if lo is not None or hi is not None:
+            values = np.clip(values, lo, hi)
+        
+        return values
+    
     def _get_metric_unit(self, metric_name: str) -> str:
         """Get appropriate unit for a metric."""
-        metric_units = {
-            'cpu': 'Percent',
-            'cpu_usage': 'Percent',
-            'processor_time': 'Percent',
-            'memory': 'Percent',
-            'memory_usage': 'Percent',
-            'available_memory': 'Bytes',
-            'response_time': 'Milliseconds',
-            'latency': 'Milliseconds',
-            'requests': 'Count',
-            'request_count': 'Count/Minute',
-            'disk_io': 'Bytes/Second',
-            'network_in': 'Bytes/Second',
-            'network_out': 'Bytes/Second'
-        }
-        
-        return metric_units.get(metric_name.lower(), 'Count')
+        return _METRIC_UNITS.get(metric_name.lower(), 'Count')
     
     def get_service_health(self) -> List[Dict[str, Any]]:
         """Get Azure service health status."""
-        services = [
-            'Virtual Machines',
-            'Storage Accounts', 
-            'App Services',
-            'SQL Database',
-            'Key Vault',
-            'Container Instances',
-            'Kubernetes Service',
-            'Function Apps'
-        ]
+        rng = self._rng
+        n = len(_HEALTH_SERVICES)
+        
+        # Draw every service's status, region and age in one batch
+        statuses = _HEALTH_STATUSES[rng.integers(0, len(_HEALTH_STATUSES), n)].tolist()
+        regions = self._region_arr[rng.integers(0, len(self._region_arr), n)].tolist()
+        minutes_ago = rng.integers(1, 31, n).tolist()
+        issue_counts = rng.integers(1, 3, n).tolist()
+        now = datetime.now()
         
         health_status = []
-        for service in services:
-            status = {
+        for service, status, region, minutes, issue_count in zip(
+                _HEALTH_SERVICES, statuses, regions, minutes_ago, issue_counts):
+            health_status.append({
                 'service': service,
-                'status': random.choice(['Healthy', 'Warning', 'Critical', 'Unknown']),
-                'region': random.choice(self.regions),
-                'last_updated': (datetime.now() - timedelta(minutes=random.randint(1, 30))).isoformat(),
-                'issues': []
-            }
-            
-            # Add some issues for non-healthy services
-            if status['status'] in ['Warning', 'Critical']:
-                issues = [
-                    'High latency detected',
-                    'Intermittent connectivity issues',
-                    'Elevated error rates',
-                    'Resource capacity constraints',
-                    'Performance degradation'
-                ]
-                status['issues'] = random.sample(issues, random.randint(1, 2))
-            
-            health_status.append(status)
+                'status': status,
+                'region': region,
+                'last_updated': (now - timedelta(minutes=minutes)).isoformat(),
+                # Add some issues for non-healthy services
+                'issues': (rng.choice(_HEALTH_ISSUES, issue_count, replace=False).tolist()
+                           if status in ('Warning', 'Critical') else [])
+            })
         
         return health_status
     
     def get_resource_utilization(self, resource_group: Optional[str] = None) -> Dict[str, Any]:
         """Get resource utilization summary."""
-        resources = self.get_resources(resource_group=resource_group)
+        df = self._filtered_resources_df(resource_group=resource_group)
         
         # Calculate utilization stats
-        total_resources = len(resources)
-        running_resources = len([r for r in resources if r['status'] == 'Running'])
-        stopped_resources = len([r for r in resources if r['status'] == 'Stopped'])
+        status_counts = df['status'].value_counts()
+        total_resources = len(df)
+        running_resources = int(status_counts.get('Running', 0))
+        stopped_resources = int(status_counts.get('Stopped', 0))
         
         utilization = {
             'total_resources': total_resources,
@@ -323,96 +563,76 @@ class AzureClient:
         """
         # Simulate action execution
         success_rate = 0.9  # 90% success rate for simulation
-        success = random.random() < success_rate
+        success = self._rng.random() < success_rate
         
         result = {
             'action': action,
             'resource_id': resource_id,
             'success': success,
             'timestamp': datetime.now().isoformat(),
-            'execution_time': f"{random.uniform(0.5, 5.0):.1f} seconds"
+            'execution_time': f"{self._rng.uniform(0.5, 5.0):.1f} seconds"
         }
         
         if success:
             result['message'] = f"Action '{action}' completed successfully"
             result['status'] = 'Completed'
+            # Resource state may have changed
+            self.invalidate_cache()
         else:
             result['message'] = f"Action '{action}' failed"
-            result['error'] = random.choice([
+            result['error'] = str(self._rng.choice([
                 'Resource not found',
                 'Insufficient permissions',
                 'Resource is in invalid state',
                 'Timeout occurred',
                 'Service temporarily unavailable'
-            ])
+            ]))
             result['status'] = 'Failed'
         
         return result
     
     def get_recommendations(self) -> List[Dict[str, Any]]:
         """Get Azure Advisor recommendations."""
-        recommendations = [
-            {
-                'category': 'Cost',
-                'title': 'Right-size underutilized virtual machines',
-                'description': 'Your virtual machines are underutilized. Consider resizing to a smaller SKU.',
-                'potential_savings': '$1,200/month',
-                'affected_resources': 12,
-                'priority': 'High',
-                'effort': 'Low'
-            },
-            {
-                'category': 'Performance', 
-                'title': 'Enable Accelerated Networking',
-                'description': 'Improve network performance by enabling accelerated networking.',
-                'potential_savings': 'Performance improvement',
-                'affected_resources': 8,
-                'priority': 'Medium',
-                'effort': 'Low'
-            },
-            {
-                'category': 'Security',
-                'title': 'Enable Azure Security Center recommendations',
-                'description': 'Apply security recommendations to improve your security posture.',
-                'potential_savings': 'Security improvement',
-                'affected_resources': 15,
-                'priority': 'High', 
-                'effort': 'Medium'
-            },
-            {
-                'category': 'Reliability',
-                'title': 'Configure backup for virtual machines',
-                'description': 'Protect your virtual machines by configuring backup.',
-                'potential_savings': 'Reliability improvement',
-                'affected_resources': 6,
-                'priority': 'Medium',
-                'effort': 'Low'
-            }
-        ]
+        return [dict(rec) for rec in _RECOMMENDATIONS]
+    
+    def dashboard_snapshot(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Fetch resources, cost data and service health in one call.
         
-        return recommendations
+        Args:
+            days: Number of days of cost data to retrieve
+            
+        Returns:
+            Dictionary with 'resources', 'cost_data' and 'service_health'
+        """
+        return {
+            'resources': self.get_resources(),
+            'cost_data': self.get_cost_data(days),
+            'service_health': self.get_service_health()
+        }
     
     def test_connection(self) -> Dict[str, Any]:
         """Test Azure connection and return status."""
         # Simulate connection test
-        success = random.random() < 0.95  # 95% success rate
+        success = self._rng.random() < 0.95  # 95% success rate
+        test_timestamp = datetime.now().isoformat()
         
         if success:
             return {
                 'connected': True,
                 'message': 'Successfully connected to Azure',
                 'subscriptions_found': len(self.subscriptions),
-                'test_timestamp': datetime.now().isoformat()
+                'test_timestamp': test_timestamp
             }
         else:
             return {
                 'connected': False,
                 'message': 'Failed to connect to Azure',
-                'error': random.choice([
+                'error': str(self._rng.choice([
                     'Invalid credentials',
                     'Network timeout',
                     'Service unavailable',
                     'Insufficient permissions'
-                ]),
-                'test_timestamp': datetime.now().isoformat()
+                ])),
+                'test_timestamp': test_timestamp
             }
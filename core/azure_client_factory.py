@@ -5,6 +5,13 @@ Creates either mock or real Azure client based on configuration.
 
 from typing import Dict, Any
 import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# The mock client is stateless apart from its caches, so one instance serves every session
+_mock_instance = None
+_mock_lock = threading.Lock()
 
 def create_azure_client(config: Dict[str, Any]):
     """
@@ -16,8 +23,6 @@ def create_azure_client(config: Dict[str, Any]):
     Returns:
         Azure client instance (mock or real)
     """
-    logger = logging.getLogger(__name__)
-    
     # Check if we should use real Azure client
     use_real_client = config.get('azure', {}).get('use_real_client', False)
     
@@ -31,7 +36,7 @@ def create_azure_client(config: Dict[str, Any]):
     
     if use_real_client and has_credentials:
         try:
-            from azure_real_client import AzureRealClient
+            from .azure_real_client import AzureRealClient
             logger.info("Creating real Azure SDK client")
             return AzureRealClient(config)
         except ImportError as e:
@@ -40,6 +45,17 @@ def create_azure_client(config: Dict[str, Any]):
             logger.warning(f"Failed to create real Azure client: {e}. Falling back to mock client.")
     
     # Default to mock client
-    from azure_client import AzureClient
-    logger.info("Creating mock Azure client")
-    return AzureClient()
+    return _get_mock_client()
+
+def _get_mock_client():
+    """Return the shared mock client, creating it on first use."""
+    global _mock_instance
+    
+    if _mock_instance is None:
+        with _mock_lock:
+            if _mock_instance is None:
+                from .azure_client import AzureClient
+                logger.info("Creating mock Azure client")
+                _mock_instance = AzureClient()
+    
+    return _mock_instance
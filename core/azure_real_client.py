@@ -3,15 +3,217 @@ Real Azure SDK Client Implementation
 Replaces mock Azure client with real Azure SDK integration.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import functools
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.costmanagement import CostManagementClient
-from azure.monitor.query import MetricsQueryClient, LogsQueryClient
 from azure.core.exceptions import AzureError
-import pandas as pd
-from azure_auth import AzureAuth
+from .azure_auth import AzureAuth, MANAGEMENT_SCOPE
+
+# The management/query SDKs and pandas are imported where they are first used
+# to keep module import (and cold start) cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from azure.mgmt.resource import ResourceManagementClient
+    from azure.mgmt.costmanagement import CostManagementClient
+    from azure.monitor.query import MetricsQueryClient
+
+def _odata_quote(value: str) -> str:
+    """Escape a string literal for an OData $filter expression."""
+    return value.replace("'", "''")
+
+_RID_RE = re.compile(
+    r'^/subscriptions/([^/]+)/resourceGroups/([^/]+)/providers/([^/]+)/([^/]+)/(.+)$',
+    re.IGNORECASE
+)
+
+class ResourceId(NamedTuple):
+    """Components of an ARM resource ID."""
+    subscription_id: str
+    resource_group: str
+    provider: str
+    resource_type: str
+    name: str
+
+@functools.lru_cache(maxsize=4096)
+def parse_rid(resource_id: str) -> Optional[ResourceId]:
+    """
+    Parse an ARM resource ID once; results are memoized per ID.
+    
+    Args:
+        resource_id: Resource identifier
+        
+    Returns:
+        ResourceId, or None if the ID is not a provider resource ID
+    """
+    match = _RID_RE.match(resource_id or '')
+    return ResourceId(*match.groups()) if match else None
+
+@dataclass(slots=True, frozen=True)
+class Resource:
+    """A listed Azure resource, without the per-row dict overhead."""
+    id: str
+    name: str
+    type: str
+    resource_group: str
+    region: str
+    tags: Dict[str, str]
+    status: str = 'Running'  # Status requires additional API calls per resource
+    created_date: Optional[str] = None  # Not available in basic resource info
+    monthly_cost: float = 0  # Requires Cost Management API
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Resource dictionary in the shape returned by get_resources."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.type,
+            'resource_group': self.resource_group,
+            'region': self.region,
+            'status': self.status,
+            'tags': self.tags,
+            'created_date': self.created_date,
+            'monthly_cost': self.monthly_cost
+        }
+
+# Units for common Azure Monitor metrics, keyed on casefolded metric name
+_METRIC_UNITS = MappingProxyType({
+    'cpu': 'Percent',
+    'percentage cpu': 'Percent',
+    'memory': 'Percent',
+    'available memory bytes': 'Bytes',
+    'network in': 'Bytes',
+    'network out': 'Bytes',
+    'disk read bytes': 'Bytes',
+    'disk write bytes': 'Bytes'
+})
+
+# Azure Monitor accepts at most this many resource IDs per batch request
+METRICS_BATCH_SIZE = 50
+
+# Upper bound on SDK calls in flight at once from the async (aget_*) paths;
+# beyond this, requests queue on shared connections and tail latency grows
+MAX_INFLIGHT_REQUESTS = 8
+
+# Long-running resource actions keyed on (provider, resource type, action), all
+# lower-cased since ARM IDs are case-insensitive. Each handler takes the client,
+# resource group and resource name and returns the SDK poller.
+_ACTION_TABLE = MappingProxyType({
+    ('microsoft.compute', 'virtualmachines', 'start'):
+        lambda client, rg, name, **kwargs: client.compute_client.virtual_machines.begin_start(rg, name, **kwargs),
+    ('microsoft.compute', 'virtualmachines', 'stop'):
+        lambda client, rg, name, **kwargs: client.compute_client.virtual_machines.begin_deallocate(rg, name, **kwargs),
+    ('microsoft.compute', 'virtualmachines', 'restart'):
+        lambda client, rg, name, **kwargs: client.compute_client.virtual_machines.begin_restart(rg, name, **kwargs),
+})
+
+def _action_handler(action: str, rid: Optional['ResourceId']):
+    """Look up the handler for an action on a parsed resource ID, or None if unsupported."""
+    if not rid:
+        return None
+    return _ACTION_TABLE.get((rid.provider.lower(), rid.resource_type.lower(), action.lower()))
+
+def _metric_namespace(resource_id: str) -> str:
+    """Metric namespace (provider/type) of an ARM resource ID, e.g. Microsoft.Compute/virtualMachines."""
+    rid = parse_rid(resource_id)
+    return f"{rid.provider}/{rid.resource_type}" if rid else ''
+
+# Bound on cached list-endpoint results per client
+_CACHE_MAXSIZE = 128
+
+def _ttl_cached(ttl: float):
+    """
+    Cache a client method's result per arguments for `ttl` seconds.
+    
+    Empty results (which the methods also return on error) are not cached,
+    so failures are retried on the next call.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            with self._cache_lock:
+                hit = self._cache.get(key)
+                if hit and hit[0] > now:
+                    return hit[1]
+            
+            value = method(self, *args, **kwargs)
+            
+            if value:
+                with self._cache_lock:
+                    if len(self._cache) >= _CACHE_MAXSIZE:
+                        # Drop expired entries, then the oldest if still full
+                        for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                            del self._cache[stale]
+                        if len(self._cache) >= _CACHE_MAXSIZE:
+                            del self._cache[next(iter(self._cache))]
+                    self._cache[key] = (now + ttl, value)
+            
+            return value
+        return wrapper
+    return decorator
+
+def _empty_cost_data() -> Dict[str, Any]:
+    """Cost data structure with no rows."""
+    return {
+        'dates': [],
+        'daily_costs': [],
+        'total_cost': 0,
+        'average_daily_cost': 0,
+        'cost_by_service': {},
+        'cost_by_resource_group': {}
+    }
+
+def _reduce_cost_rows(rows: list, columns: List[str]) -> 'pd.DataFrame':
+    """
+    Parse raw cost query rows and sum them per day and service.
+    
+    Module-level so it can run in a worker process.
+    
+    Args:
+        rows: Rows from a Cost Management query result
+        columns: Column names of the result
+        
+    Returns:
+        DataFrame with UsageDate, ServiceName and cost columns
+    """
+    import pandas as pd
+    
+    df = pd.DataFrame(rows, columns=columns)
+    if df.empty:
+        return pd.DataFrame({'UsageDate': pd.Series(dtype='datetime64[ns]'),
+                             'ServiceName': pd.Series(dtype=object),
+                             'cost': pd.Series(dtype=float)})
+    
+    # The aggregation column is named after its key in the query definition
+    cost_col = 'totalCost' if 'totalCost' in df.columns else 'PreTaxCost'
+    df['cost'] = pd.to_numeric(df[cost_col], errors='coerce').fillna(0)
+    df['UsageDate'] = pd.to_datetime(df['UsageDate'].astype(str), format='%Y%m%d')
+    
+    return df.groupby(['UsageDate', 'ServiceName'], as_index=False)['cost'].sum()
+
+def _cost_summary(costs: 'pd.DataFrame') -> Dict[str, Any]:
+    """Build the cost data dictionary from non-empty reduced cost rows."""
+    daily = costs.groupby('UsageDate')['cost'].sum().sort_index()
+    
+    return {
+        'dates': daily.index.strftime('%Y-%m-%d').tolist(),
+        'daily_costs': daily.tolist(),
+        'total_cost': float(daily.sum()),
+        'average_daily_cost': float(daily.mean()),
+        'cost_by_service': costs.groupby('ServiceName')['cost'].sum().to_dict(),
+        'cost_by_resource_group': {}
+    }
 
 class AzureRealClient:
     """
@@ -32,58 +234,188 @@ class AzureRealClient:
         self._resource_client = None
         self._cost_client = None
         self._metrics_client = None
+        self._metrics_batch_client = None
         self._logs_client = None
+        self._subscription_client = None
+        self._health_client = None
+        self._compute_client = None
+        
+        # TTL cache for list endpoints, see _ttl_cached
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        
+        # One HTTP transport (and connection pool) shared by every SDK client
+        self._transport = None
+        self._arm_transport = None
+        
+        # Caps concurrent fan-out from the async paths, see _run_bounded
+        self._inflight = threading.BoundedSemaphore(MAX_INFLIGHT_REQUESTS)
     
     def _ensure_authenticated(self):
         """Ensure we have valid credentials."""
         if not self.credential:
             self.credential = self.auth.get_credential()
-            self.subscription_id = self.auth.get_subscription_id()
+            self.subscription_id = self.auth.subscription_id
             
             if not self.subscription_id:
                 raise Exception("Azure subscription ID not configured")
     
     @property
-    def resource_client(self) -> ResourceManagementClient:
+    def transport(self):
+        """Get or create the shared HTTP transport for all SDK clients."""
+        if self._transport is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from azure.core.pipeline.transport import RequestsTransport
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            # The clients must not close a session they share
+            self._transport = RequestsTransport(session=session, session_owner=False)
+        return self._transport
+    
+    @property
+    def arm_transport(self):
+        """
+        Get or create the load-balanced transport for high-volume ARM clients.
+        
+        Pool size and recycle threshold come from azure.arm_connections and
+        azure.arm_recycle_threshold.
+        """
+        if self._arm_transport is None:
+            from .arm_balancer import ArmBalancerTransport
+            
+            azure_config = self.config.get('azure', {})
+            self._arm_transport = ArmBalancerTransport(
+                pool_size=int(azure_config.get('arm_connections', 8)),
+                recycle_threshold=int(azure_config.get('arm_recycle_threshold', 100))
+            )
+        return self._arm_transport
+    
+    @property
+    def resource_client(self) -> 'ResourceManagementClient':
         """Get or create Resource Management client."""
         if not self._resource_client:
+            from azure.mgmt.resource import ResourceManagementClient
+            
             self._ensure_authenticated()
             self._resource_client = ResourceManagementClient(
                 credential=self.credential,
-                subscription_id=self.subscription_id
+                credential_scopes=[MANAGEMENT_SCOPE],
+                subscription_id=self.subscription_id,
+                transport=self.arm_transport
             )
         return self._resource_client
     
     @property
-    def cost_client(self) -> CostManagementClient:
+    def cost_client(self) -> 'CostManagementClient':
         """Get or create Cost Management client."""
         if not self._cost_client:
+            from azure.mgmt.costmanagement import CostManagementClient
+            
             self._ensure_authenticated()
             self._cost_client = CostManagementClient(
-                credential=self.credential
+                credential=self.credential,
+                credential_scopes=[MANAGEMENT_SCOPE],
+                transport=self.arm_transport
             )
         return self._cost_client
     
     @property
-    def metrics_client(self) -> MetricsQueryClient:
+    def metrics_client(self) -> 'MetricsQueryClient':
         """Get or create Metrics Query client."""
         if not self._metrics_client:
+            from azure.monitor.query import MetricsQueryClient
+            
             self._ensure_authenticated()
             self._metrics_client = MetricsQueryClient(
-                credential=self.credential
+                credential=self.credential,
+                transport=self.transport
             )
         return self._metrics_client
     
-    def get_subscriptions(self) -> List[str]:
-        """Get list of available Azure subscriptions."""
-        try:
+    @property
+    def subscription_client(self):
+        """Get or create Subscription client."""
+        if not self._subscription_client:
             self._ensure_authenticated()
             from azure.mgmt.resource.subscriptions import SubscriptionClient
+            self._subscription_client = SubscriptionClient(
+                credential=self.credential,
+                credential_scopes=[MANAGEMENT_SCOPE],
+                transport=self.transport
+            )
+        return self._subscription_client
+    
+    @property
+    def health_client(self):
+        """Get or create Resource Health client."""
+        if not self._health_client:
+            self._ensure_authenticated()
+            from azure.mgmt.resourcehealth import ResourceHealthMgmtClient
+            self._health_client = ResourceHealthMgmtClient(
+                credential=self.credential,
+                credential_scopes=[MANAGEMENT_SCOPE],
+                subscription_id=self.subscription_id,
+                transport=self.transport
+            )
+        return self._health_client
+    
+    @property
+    def compute_client(self):
+        """Get or create Compute Management client."""
+        if not self._compute_client:
+            self._ensure_authenticated()
+            from azure.mgmt.compute import ComputeManagementClient
+            self._compute_client = ComputeManagementClient(
+                credential=self.credential,
+                credential_scopes=[MANAGEMENT_SCOPE],
+                subscription_id=self.subscription_id,
+                transport=self.transport
+            )
+        return self._compute_client
+    
+    @property
+    def metrics_batch_client(self):
+        """
+        Get or create the batch metrics client.
+        
+        Returns:
+            MetricsClient for the configured regional endpoint, or None if
+            no endpoint is configured or the SDK does not provide one
+        """
+        if self._metrics_batch_client is None:
+            endpoint = self.config.get('azure', {}).get('metrics_endpoint')
+            if not endpoint:
+                return None
+            
+            try:
+                from azure.monitor.querymetrics import MetricsClient
+            except ImportError:
+                try:
+                    from azure.monitor.query import MetricsClient
+                except ImportError:
+                    return None
             
-            sub_client = SubscriptionClient(credential=self.credential)
+            self._ensure_authenticated()
+            self._metrics_batch_client = MetricsClient(endpoint, self.credential, transport=self.transport)
+        return self._metrics_batch_client
+    
+    def invalidate_cache(self):
+        """Drop all cached list-endpoint results."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    @_ttl_cached(300)
+    def get_subscriptions(self) -> List[str]:
+        """Get list of available Azure subscriptions."""
+        try:
             subscriptions = []
             
-            for sub in sub_client.subscriptions.list():
+            for sub in self.subscription_client.subscriptions.list():
                 subscriptions.append(sub.display_name or sub.subscription_id)
             
             return subscriptions
@@ -91,6 +423,7 @@ class AzureRealClient:
             self.logger.error(f"Failed to get subscriptions: {e}")
             return []
     
+    @_ttl_cached(300)
     def get_resource_groups(self, subscription_id: Optional[str] = None) -> List[str]:
         """Get list of resource groups for a subscription."""
         try:
@@ -104,6 +437,7 @@ class AzureRealClient:
             self.logger.error(f"Failed to get resource groups: {e}")
             return []
     
+    @_ttl_cached(60)
     def get_resources(self, resource_group: Optional[str] = None, 
                      resource_type: Optional[str] = None,
                      region: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -119,121 +453,277 @@ class AzureRealClient:
             List of resource dictionaries
         """
         try:
-            resources = []
+            return list(self.iter_resources(resource_group, resource_type, region))
+        except Exception as e:
+            self.logger.error(f"Failed to get resources: {e}")
+            return []
+    
+    def iter_resources(self, resource_group: Optional[str] = None,
+                       resource_type: Optional[str] = None,
+                       region: Optional[str] = None,
+                       limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream Azure resources page by page with optional filtering.
+        
+        Args:
+            resource_group: Filter by resource group
+            resource_type: Filter by resource type
+            region: Filter by region
+            limit: Stop after this many resources
             
-            # Get resources based on filter
-            if resource_group and resource_group != "All":
-                resource_list = self.resource_client.resources.list_by_resource_group(
-                    resource_group_name=resource_group
-                )
-            else:
-                resource_list = self.resource_client.resources.list()
+        Yields:
+            Resource dictionaries
             
-            for resource in resource_list:
-                # Parse resource type
-                res_type = resource.type.split('/')[-1] if resource.type else 'Unknown'
-                
-                # Apply filters
-                if resource_type and resource_type != "All":
-                    if res_type.lower() != resource_type.lower():
-                        continue
-                
-                if region and region != "All":
-                    if resource.location.lower() != region.lower():
-                        continue
-                
-                # Build resource dictionary
-                resource_dict = {
-                    'id': resource.id,
-                    'name': resource.name,
-                    'type': res_type,
-                    'resource_group': resource.id.split('/')[4] if len(resource.id.split('/')) > 4 else 'Unknown',
-                    'region': resource.location,
-                    'status': 'Running',  # Status requires additional API calls per resource
-                    'tags': resource.tags or {},
-                    'created_date': None,  # Not available in basic resource info
-                    'monthly_cost': 0  # Requires Cost Management API
-                }
-                
-                resources.append(resource_dict)
+        Raises:
+            AzureError: If listing fails; get_resources handles this for list callers
+        """
+        for resource in self.iter_resource_objects(resource_group, resource_type, region, limit):
+            yield resource.to_dict()
+    
+    def get_resources_df(self, resource_group: Optional[str] = None,
+                         resource_type: Optional[str] = None,
+                         region: Optional[str] = None) -> 'pd.DataFrame':
+        """
+        Get Azure resources as a DataFrame, built column by column in one pass.
+        
+        Args:
+            resource_group: Filter by resource group
+            resource_type: Filter by resource type
+            region: Filter by region
             
-            return resources
+        Returns:
+            DataFrame with one row per resource (empty on error)
+        """
+        import pandas as pd
+        
+        columns = {field: [] for field in Resource.__slots__}
+        
+        try:
+            for resource in self.iter_resource_objects(resource_group, resource_type, region):
+                for field, values in columns.items():
+                    values.append(getattr(resource, field))
         except Exception as e:
             self.logger.error(f"Failed to get resources: {e}")
-            return []
+            columns = {field: [] for field in Resource.__slots__}
+        
+        return pd.DataFrame(columns)
+    
+    def iter_resource_objects(self, resource_group: Optional[str] = None,
+                              resource_type: Optional[str] = None,
+                              region: Optional[str] = None,
+                              limit: Optional[int] = None) -> Iterator[Resource]:
+        """
+        Stream Azure resources as lightweight Resource records.
+        
+        Region and fully qualified resource types (e.g. Microsoft.Compute/virtualMachines)
+        are sent to ARM as a $filter so non-matching resources are never fetched.
+        Short type names are matched client-side against the last type segment.
+        
+        With a limit, paging stops as soon as enough resources have been yielded,
+        and the limit is sent as $top when no client-side matching is needed.
+        
+        Args:
+            resource_group: Filter by resource group
+            resource_type: Filter by resource type
+            region: Filter by region
+            limit: Stop after this many resources
+            
+        Yields:
+            Resource records
+        """
+        clauses = []
+        type_match = None
+        
+        if resource_type and resource_type != "All":
+            if '/' in resource_type:
+                clauses.append(f"resourceType eq '{_odata_quote(resource_type)}'")
+            else:
+                type_match = resource_type.lower()
+        
+        if region and region != "All":
+            clauses.append(f"location eq '{_odata_quote(region.lower())}'")
+        
+        odata_filter = ' and '.join(clauses) or None
+        
+        # $top would cut the page before client-side type matching, so only send it without one
+        top = limit if limit and type_match is None else None
+        
+        # Get resources based on filter
+        if resource_group and resource_group != "All":
+            resource_list = self.resource_client.resources.list_by_resource_group(
+                resource_group_name=resource_group,
+                filter=odata_filter,
+                top=top
+            )
+        else:
+            resource_list = self.resource_client.resources.list(filter=odata_filter, top=top)
+        
+        yielded = 0
+        for resource in resource_list:
+            # Parse resource type
+            res_type = resource.type.split('/')[-1] if resource.type else 'Unknown'
+            
+            if type_match and res_type.lower() != type_match:
+                continue
+            
+            rid = parse_rid(resource.id)
+            
+            yield Resource(
+                id=resource.id,
+                name=resource.name,
+                type=res_type,
+                resource_group=rid.resource_group if rid else 'Unknown',
+                region=resource.location,
+                tags=resource.tags or {}
+            )
+            
+            # The pager follows continuation links lazily, so returning here stops paging
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
     
-    def get_cost_data(self, days: int = 30) -> Dict[str, Any]:
+    def _cost_query(self, days: int, resource_group: Optional[str] = None):
+        """
+        Build the daily cost-by-service query definition.
+        
+        Args:
+            days: Number of days to retrieve data for
+            resource_group: Only include costs for this resource group (filtered server-side)
+            
+        Returns:
+            Cost Management QueryDefinition
+        """
+        from azure.mgmt.costmanagement.models import (
+            QueryDefinition, QueryDataset, QueryAggregation,
+            QueryTimePeriod, QueryGrouping, TimeframeType,
+            QueryFilter, QueryComparisonExpression
+        )
+        
+        # Define time period
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        
+        # Scope the query to one resource group on the server rather than after download
+        query_filter = None
+        if resource_group and resource_group != "All":
+            query_filter = QueryFilter(
+                dimensions=QueryComparisonExpression(
+                    name="ResourceGroupName", operator="In", values=[resource_group]
+                )
+            )
+        
+        return QueryDefinition(
+            type="Usage",
+            timeframe=TimeframeType.CUSTOM,
+            time_period=QueryTimePeriod(
+                from_property=start_date,
+                to=end_date
+            ),
+            dataset=QueryDataset(
+                granularity="Daily",
+                aggregation={
+                    "totalCost": QueryAggregation(name="PreTaxCost", function="Sum")
+                },
+                grouping=[
+                    QueryGrouping(type="Dimension", name="ServiceName")
+                ],
+                filter=query_filter
+            )
+        )
+    
+    def _query_cost_rows(self, subscription_id: str, query) -> Tuple[list, List[str]]:
+        """Run a cost query against one subscription and return its raw rows and column names."""
+        result = self.cost_client.query.usage(scope=f"/subscriptions/{subscription_id}", parameters=query)
+        return result.rows, [c.name for c in result.columns]
+    
+    def get_cost_data(self, days: int = 30, resource_group: Optional[str] = None) -> Dict[str, Any]:
         """
         Get cost management data for specified time period.
         
         Args:
             days: Number of days to retrieve data for
+            resource_group: Only include costs for this resource group (filtered server-side)
             
         Returns:
             Dictionary with cost data and trends
         """
         try:
-            from azure.mgmt.costmanagement.models import (
-                QueryDefinition, QueryDataset, QueryAggregation,
-                QueryTimePeriod, QueryGrouping, TimeframeType
-            )
+            query = self._cost_query(days, resource_group)
             
-            # Define time period
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            # Create query definition
-            query = QueryDefinition(
-                type="Usage",
-                timeframe=TimeframeType.CUSTOM,
-                time_period=QueryTimePeriod(
-                    from_property=start_date,
-                    to=end_date
-                ),
-                dataset=QueryDataset(
-                    granularity="Daily",
-                    aggregation={
-                        "totalCost": QueryAggregation(name="PreTaxCost", function="Sum")
-                    },
-                    grouping=[
-                        QueryGrouping(type="Dimension", name="ServiceName")
-                    ]
-                )
-            )
+            self._ensure_authenticated()
+            rows, columns = self._query_cost_rows(self.subscription_id, query)
+            
+            costs = _reduce_cost_rows(rows, columns)
+            if costs.empty:
+                return _empty_cost_data()
+            
+            cost_data = _cost_summary(costs)
+            if resource_group and resource_group != "All":
+                cost_data['cost_by_resource_group'] = {resource_group: cost_data['total_cost']}
+            return cost_data
+        except Exception as e:
+            self.logger.error(f"Failed to get cost data: {e}")
+            # Return empty structure on error
+            return _empty_cost_data()
+    
+    def get_cost_data_multi(self, subscription_ids: List[str], days: int = 30) -> Dict[str, Any]:
+        """
+        Get cost data summed across several subscriptions.
+        
+        The queries are issued concurrently from this process, which keeps the
+        credential and SDK clients here. Only the raw rows are sent to a process
+        pool for parsing and grouping, and the reduced frames are merged here.
+        
+        Args:
+            subscription_ids: Subscriptions to include
+            days: Number of days to retrieve data for
+            
+        Returns:
+            Dictionary with cost data and trends, plus 'cost_by_subscription'
+        """
+        import pandas as pd
+        
+        try:
+            query = self._cost_query(days)
+            self._ensure_authenticated()
             
-            # Execute query
-            scope = f"/subscriptions/{self.subscription_id}"
-            result = self.cost_client.query.usage(scope=scope, parameters=query)
+            async def fetch_all():
+                return await asyncio.gather(*(
+                    self._run_bounded(self._query_cost_rows, subscription_id, query)
+                    for subscription_id in subscription_ids
+                ), return_exceptions=True)
             
-            # Process results
-            dates = []
-            daily_costs = []
-            cost_by_service = {}
+            fetched = {}
+            for subscription_id, result in zip(subscription_ids, asyncio.run(fetch_all())):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Failed to get cost data for {subscription_id}: {result}")
+                else:
+                    fetched[subscription_id] = result
             
-            for row in result.rows:
-                # Parse row data based on columns
-                # Format varies, need to adapt based on actual response
-                pass
+            if not fetched:
+                return {**_empty_cost_data(), 'cost_by_subscription': {}}
             
-            return {
-                'dates': dates,
-                'daily_costs': daily_costs,
-                'total_cost': sum(daily_costs) if daily_costs else 0,
-                'average_daily_cost': sum(daily_costs) / len(daily_costs) if daily_costs else 0,
-                'cost_by_service': cost_by_service,
-                'cost_by_resource_group': {}
+            if len(fetched) > 1:
+                workers = min(len(fetched), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    reduced = list(pool.map(_reduce_cost_rows, *zip(*fetched.values())))
+            else:
+                reduced = [_reduce_cost_rows(*next(iter(fetched.values())))]
+            
+            cost_by_subscription = {
+                subscription_id: float(costs['cost'].sum())
+                for subscription_id, costs in zip(fetched, reduced)
             }
+            
+            costs = pd.concat(reduced, ignore_index=True)
+            if costs.empty:
+                return {**_empty_cost_data(), 'cost_by_subscription': cost_by_subscription}
+            
+            costs = costs.groupby(['UsageDate', 'ServiceName'], as_index=False)['cost'].sum()
+            return {**_cost_summary(costs), 'cost_by_subscription': cost_by_subscription}
         except Exception as e:
             self.logger.error(f"Failed to get cost data: {e}")
-            # Return empty structure on error
-            return {
-                'dates': [],
-                'daily_costs': [],
-                'total_cost': 0,
-                'average_daily_cost': 0,
-                'cost_by_service': {},
-                'cost_by_resource_group': {}
-            }
+            return {**_empty_cost_data(), 'cost_by_subscription': {}}
     
     def get_performance_metrics(self, resource_id: str, 
                               metric_name: str, 
@@ -249,79 +739,124 @@ class AzureRealClient:
         Returns:
             Dictionary with metric data points
         """
-        try:
+        return self.get_performance_metrics_bulk([resource_id], metric_name, hours)[resource_id]
+    
+    def get_performance_metrics_bulk(self, resource_ids: List[str],
+                                     metric_name: str,
+                                     hours: int = 24) -> Dict[str, Dict[str, Any]]:
+        """
+        Get performance metrics for several resources with as few requests as possible.
+        
+        When a regional metrics endpoint is configured (azure.metrics_endpoint),
+        resources are grouped by metric namespace and queried in batches of
+        METRICS_BATCH_SIZE through the Azure Monitor batch API. Anything the batch
+        path cannot serve falls back to one query_resource call per resource.
+        
+        Args:
+            resource_ids: Resource identifiers
+            metric_name: Name of the metric (CPU, Memory, etc.)
+            hours: Number of hours of data to retrieve
+            
+        Returns:
+            Dictionary mapping each resource ID to its metric data
+        """
+        # Define time period
+        end_time = datetime.now()
+        start_time = end_time - timedelta(hours=hours)
+        unit = self._get_metric_unit(metric_name)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        batch_client = self.metrics_batch_client
+        if batch_client is not None:
             from azure.monitor.query import MetricAggregationType
             
-            # Define time period
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=hours)
-            
-            # Query metrics
-            response = self.metrics_client.query_resource(
-                resource_uri=resource_id,
-                metric_names=[metric_name],
-                timespan=(start_time, end_time),
-                granularity=timedelta(minutes=5),
-                aggregations=[MetricAggregationType.AVERAGE]
-            )
+            by_namespace: Dict[str, List[str]] = {}
+            for resource_id in resource_ids:
+                by_namespace.setdefault(_metric_namespace(resource_id), []).append(resource_id)
             
-            timestamps = []
-            values = []
+            for namespace, ids in by_namespace.items():
+                for start in range(0, len(ids), METRICS_BATCH_SIZE):
+                    chunk = ids[start:start + METRICS_BATCH_SIZE]
+                    try:
+                        responses = batch_client.query_resources(
+                            resource_ids=chunk,
+                            metric_namespace=namespace,
+                            metric_names=[metric_name],
+                            timespan=(start_time, end_time),
+                            granularity=timedelta(minutes=5),
+                            aggregations=[MetricAggregationType.AVERAGE]
+                        )
+                        # Results come back in request order
+                        for resource_id, response in zip(chunk, responses):
+                            results[resource_id] = self._metric_result(resource_id, metric_name, unit, response)
+                    except Exception as e:
+                        self.logger.warning(f"Batched metrics query failed for {namespace}, falling back: {e}")
+        
+        for resource_id in resource_ids:
+            if resource_id in results:
+                continue
             
+            try:
+                from azure.monitor.query import MetricAggregationType
+                
+                # Query metrics
+                response = self.metrics_client.query_resource(
+                    resource_uri=resource_id,
+                    metric_names=[metric_name],
+                    timespan=(start_time, end_time),
+                    granularity=timedelta(minutes=5),
+                    aggregations=[MetricAggregationType.AVERAGE]
+                )
+                results[resource_id] = self._metric_result(resource_id, metric_name, unit, response)
+            except Exception as e:
+                self.logger.error(f"Failed to get performance metrics: {e}")
+                results[resource_id] = self._metric_result(resource_id, metric_name, unit, None)
+        
+        return results
+    
+    def _metric_result(self, resource_id: str, metric_name: str, unit: str, response) -> Dict[str, Any]:
+        """Flatten a metrics query response into the metric data dictionary."""
+        ts_raw = []
+        values = []
+        
+        if response is not None:
             for metric in response.metrics:
                 for time_series in metric.timeseries:
                     for data_point in time_series.data:
-                        timestamps.append(data_point.time_stamp.isoformat())
+                        ts_raw.append(data_point.time_stamp)
                         values.append(data_point.average or 0)
+        
+        timestamps = []
+        if ts_raw:
+            import numpy as np
+            import pandas as pd
             
-            return {
-                'resource_id': resource_id,
-                'metric_name': metric_name,
-                'timestamps': timestamps,
-                'values': values,
-                'unit': self._get_metric_unit(metric_name),
-                'aggregation': 'Average'
-            }
-        except Exception as e:
-            self.logger.error(f"Failed to get performance metrics: {e}")
-            return {
-                'resource_id': resource_id,
-                'metric_name': metric_name,
-                'timestamps': [],
-                'values': [],
-                'unit': self._get_metric_unit(metric_name),
-                'aggregation': 'Average'
-            }
+            # Format every point in one call instead of isoformat() per point
+            utc = pd.to_datetime(ts_raw, utc=True).tz_localize(None).to_numpy()
+            timestamps = np.datetime_as_string(utc, unit='s', timezone='UTC').tolist()
+        
+        return {
+            'resource_id': resource_id,
+            'metric_name': metric_name,
+            'timestamps': timestamps,
+            'values': values,
+            'unit': unit,
+            'aggregation': 'Average'
+        }
     
     def _get_metric_unit(self, metric_name: str) -> str:
         """Get appropriate unit for a metric."""
-        metric_units = {
-            'cpu': 'Percent',
-            'percentage cpu': 'Percent',
-            'memory': 'Percent',
-            'available memory bytes': 'Bytes',
-            'network in': 'Bytes',
-            'network out': 'Bytes',
-            'disk read bytes': 'Bytes',
-            'disk write bytes': 'Bytes'
-        }
-        
-        return metric_units.get(metric_name.lower(), 'Count')
+        return _METRIC_UNITS.get(metric_name.casefold(), 'Count')
     
+    @_ttl_cached(300)
     def get_service_health(self) -> List[Dict[str, Any]]:
         """Get Azure service health status."""
         try:
-            from azure.mgmt.resourcehealth import ResourceHealthMgmtClient
-            
-            health_client = ResourceHealthMgmtClient(
-                credential=self.credential,
-                subscription_id=self.subscription_id
-            )
-            
             health_status = []
             
             # Get availability statuses for resources
-            for status in health_client.availability_statuses.list_by_subscription_id(
+            for status in self.health_client.availability_statuses.list_by_subscription_id(
                 subscription_id=self.subscription_id
             ):
                 health_status.append({
@@ -350,36 +885,25 @@ class AzureRealClient:
             Dictionary with action result
         """
         try:
-            # Parse resource ID to get provider and resource info
-            parts = resource_id.split('/')
+            # Parse resource ID once and dispatch on (provider, type, action)
+            rid = parse_rid(resource_id)
+            handler = _action_handler(action, rid)
             
-            if 'Microsoft.Compute' in resource_id and 'virtualMachines' in resource_id:
-                from azure.mgmt.compute import ComputeManagementClient
-                
-                compute_client = ComputeManagementClient(
-                    credential=self.credential,
-                    subscription_id=self.subscription_id
-                )
+            if handler:
+                poller = handler(self, rid.resource_group, rid.name)
                 
-                rg_name = parts[4]
-                vm_name = parts[8]
-                
-                if action.lower() == 'start':
-                    result = compute_client.virtual_machines.begin_start(rg_name, vm_name)
-                elif action.lower() == 'stop':
-                    result = compute_client.virtual_machines.begin_deallocate(rg_name, vm_name)
-                elif action.lower() == 'restart':
-                    result = compute_client.virtual_machines.begin_restart(rg_name, vm_name)
-                else:
-                    raise Exception(f"Unsupported action: {action}")
+                # Resource state is changing
+                self.invalidate_cache()
                 
+                # The operation runs on in Azure; callers follow it with get_action_status
                 return {
                     'action': action,
                     'resource_id': resource_id,
                     'success': True,
                     'timestamp': datetime.now().isoformat(),
                     'message': f"Action '{action}' initiated successfully",
-                    'status': 'Completed'
+                    'status': 'InProgress',
+                    'operation_token': poller.continuation_token()
                 }
             else:
                 raise Exception(f"Action '{action}' not supported for this resource type")
@@ -396,6 +920,112 @@ class AzureRealClient:
                 'status': 'Failed'
             }
     
+    def get_action_status(self, action: str, resource_id: str, operation_token: str) -> Dict[str, Any]:
+        """
+        Check the progress of an action started with execute_action, without waiting.
+        
+        Args:
+            action: Action that was started (start, stop, restart)
+            resource_id: Target resource identifier
+            operation_token: operation_token returned by execute_action
+            
+        Returns:
+            Dictionary with 'done' and 'status' ('InProgress', 'Completed' or 'Failed')
+        """
+        try:
+            rid = parse_rid(resource_id)
+            handler = _action_handler(action, rid)
+            if handler is None:
+                raise Exception(f"Action '{action}' not supported for this resource type")
+            
+            # Rehydrate the poller from its token; this issues no new operation
+            poller = handler(self, rid.resource_group, rid.name, continuation_token=operation_token)
+            done = poller.done()
+            status = poller.status()
+            
+            if done:
+                self.invalidate_cache()
+            
+            return {
+                'action': action,
+                'resource_id': resource_id,
+                'done': done,
+                'status': ('Completed' if status.lower() == 'succeeded' else 'Failed') if done else 'InProgress',
+                'provisioning_state': status,
+                'timestamp': datetime.now().isoformat()
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to get action status: {e}")
+            return {
+                'action': action,
+                'resource_id': resource_id,
+                'done': False,
+                'status': 'Unknown',
+                'error': str(e),
+                'timestamp': datetime.now().isoformat()
+            }
+    
+    async def _run_bounded(self, func, *args):
+        """
+        Run a blocking SDK call on a worker thread, at most MAX_INFLIGHT_REQUESTS at a time.
+        
+        The semaphore is taken inside the worker thread, so it holds across the
+        separate event loops that each asyncio.run call creates.
+        """
+        def call():
+            with self._inflight:
+                return func(*args)
+        
+        return await asyncio.to_thread(call)
+    
+    async def aget_resources(self, resource_group: Optional[str] = None,
+                             resource_type: Optional[str] = None,
+                             region: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Async variant of get_resources."""
+        return await self._run_bounded(self.get_resources, resource_group, resource_type, region)
+    
+    async def aget_cost_data(self, days: int = 30, resource_group: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of get_cost_data."""
+        return await self._run_bounded(self.get_cost_data, days, resource_group)
+    
+    async def aget_service_health(self) -> List[Dict[str, Any]]:
+        """Async variant of get_service_health."""
+        return await self._run_bounded(self.get_service_health)
+    
+    async def aget_performance_metrics(self, resource_id: str, metric_name: str,
+                                       hours: int = 24) -> Dict[str, Any]:
+        """Async variant of get_performance_metrics."""
+        return await self._run_bounded(self.get_performance_metrics, resource_id, metric_name, hours)
+    
+    async def _dashboard_snapshot(self, days: int) -> Dict[str, Any]:
+        resources, cost_data, service_health = await asyncio.gather(
+            self.aget_resources(),
+            self.aget_cost_data(days),
+            self.aget_service_health()
+        )
+        return {
+            'resources': resources,
+            'cost_data': cost_data,
+            'service_health': service_health
+        }
+    
+    def dashboard_snapshot(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Fetch resources, cost data and service health concurrently.
+        
+        The three calls are independent and network-bound, so total latency is
+        roughly that of the slowest one. Each runs the regular sync method on a
+        worker thread, sharing this client's credential and SDK clients.
+        
+        Args:
+            days: Number of days of cost data to retrieve
+            
+        Returns:
+            Dictionary with 'resources', 'cost_data' and 'service_health'
+        """
+        self._ensure_authenticated()
+        return asyncio.run(self._dashboard_snapshot(days))
+    
     def test_connection(self) -> Dict[str, Any]:
         """Test Azure connection and return status."""
         auth_result = self.auth.test_authentication()
@@ -1,16 +1,76 @@
 import os
+import copy
 import json
+import mmap
+import functools
+import contextlib
 import yaml
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+# Faster parsers when available: orjson for JSON, libyaml's C loader for YAML
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Config files merged over the defaults, lowest priority first
+_CONFIG_FILES = ('config.yaml', 'config.json')
+
+_env_loaded = False
+
+def _ensure_env_loaded():
+    """Load the .env file once per process."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+def _config_mtimes() -> tuple:
+    """Modification time of each config file, or None if it does not exist."""
+    mtimes = []
+    for path in _CONFIG_FILES:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+@contextlib.contextmanager
+def _mapped(path: str):
+    """
+    Map a config file read-only so parsers read it without an extra file buffer.
+    
+    Yields the mmap (a readable stream that also supports the buffer protocol),
+    or empty bytes for an empty file, which cannot be mapped.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from environment variables and config files.
     Priority: Environment variables > config.yaml > .env > defaults
+    
+    The result is cached and rebuilt only when a config file is created,
+    modified or removed. Each call returns an independent copy that callers
+    may modify.
     """
+    return copy.deepcopy(_load_config_cached(_config_mtimes()))
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(mtimes: tuple) -> Dict[str, Any]:
+    """Build the configuration for the given config file modification times."""
+    yaml_mtime, json_mtime = mtimes
+    
     # Load .env file if it exists
-    load_dotenv()
+    _ensure_env_loaded()
     
     config = {
         'database': {
@@ -19,19 +79,29 @@ def load_config() -> Dict[str, Any]:
             'database': os.getenv('PGDATABASE', 'azure_support'),
             'username': os.getenv('PGUSER', 'postgres'),
             'password': os.getenv('PGPASSWORD', ''),
-            'url': os.getenv('DATABASE_URL', '')
+            'url': os.getenv('DATABASE_URL', ''),
+            'pool_size': int(os.getenv('DB_POOL_SIZE', '15')),
+            'max_overflow': int(os.getenv('DB_POOL_MAX_OVERFLOW', '10')),
+            'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '30')),
+            'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+            'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true',
+            'connect_attempts': int(os.getenv('DB_CONNECT_ATTEMPTS', '5'))
         },
         'azure': {
             'tenant_id': os.getenv('AZURE_TENANT_ID', ''),
             'client_id': os.getenv('AZURE_CLIENT_ID', ''),
             'client_secret': os.getenv('AZURE_CLIENT_SECRET', ''),
             'subscription_id': os.getenv('AZURE_SUBSCRIPTION_ID', ''),
+            'metrics_endpoint': os.getenv('AZURE_METRICS_ENDPOINT', ''),
+            'arm_connections': int(os.getenv('AZURE_ARM_CONNECTIONS', '8')),
+            'arm_recycle_threshold': int(os.getenv('AZURE_ARM_RECYCLE_THRESHOLD', '100')),
         },
         'app': {
             'debug': os.getenv('DEBUG', 'False').lower() == 'true',
             'host': os.getenv('HOST', '0.0.0.0'),
             'port': int(os.getenv('PORT', '5000')),
             'secret_key': os.getenv('SESSION_SECRET', 'dev-secret-key'),
+            'auth_mode': os.getenv('AUTH_MODE', 'optional').lower(),
             'auto_refresh': os.getenv('AUTO_REFRESH', 'True').lower() == 'true',
             'refresh_interval': int(os.getenv('REFRESH_INTERVAL', '30'))
         },
@@ -45,9 +115,9 @@ def load_config() -> Dict[str, Any]:
     
     # Try to load config.yaml if it exists
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r') as f:
-                yaml_config = yaml.safe_load(f)
+        if yaml_mtime is not None:
+            with _mapped('config.yaml') as data:
+                yaml_config = yaml.load(data, Loader=_YamlLoader)
                 # Merge with existing config, giving priority to yaml
                 config = merge_configs(config, yaml_config)
     except Exception as e:
@@ -55,9 +125,9 @@ def load_config() -> Dict[str, Any]:
     
     # Try to load config.json if it exists
     try:
-        if os.path.exists('config.json'):
-            with open('config.json', 'r') as f:
-                json_config = json.load(f)
+        if json_mtime is not None:
+            with _mapped('config.json') as data:
+                json_config = orjson.loads(memoryview(data)) if orjson else json.loads(data[:])
                 # Merge with existing config, giving priority to json
                 config = merge_configs(config, json_config)
     except Exception as e:
@@ -86,6 +156,8 @@ def save_config(config: Dict[str, Any], format: str = 'yaml') -> bool:
         else:
             raise ValueError(f"Unsupported format: {format}")
         
+        # Pick up the saved file on the next load
+        _load_config_cached.cache_clear()
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
@@ -95,22 +167,27 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     """
     Merge two configuration dictionaries, with override taking precedence.
     
+    The merge is done in place on base; deep-copy it first if the original
+    must be kept.
+    
     Args:
-        base: Base configuration dictionary
+        base: Base configuration dictionary (modified in place)
         override: Override configuration dictionary
     
     Returns:
-        Merged configuration dictionary
+        The merged base dictionary
     """
-    result = base.copy()
+    stack = [(base, override)]
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     
-    return result
+    return base
 
 def get_database_url(config: Dict[str, Any]) -> str:
     """
@@ -166,6 +243,9 @@ def validate_config(config: Dict[str, Any]) -> tuple[bool, list]:
     except (ValueError, TypeError):
         errors.append("App port must be a valid integer")
     
+    if app_config.get('auth_mode', 'optional') not in ('none', 'optional', 'required'):
+        errors.append("App auth_mode must be one of: none, optional, required")
+    
     # Validate Azure config (optional, but if provided should be complete)
     azure_config = config.get('azure', {})
     if azure_config.get('tenant_id') or azure_config.get('client_id'):
@@ -1,24 +1,155 @@
+import io
 import os
 import json
+import time
+import random
+import uuid
+import itertools
 import sqlite3
+import threading
+import weakref
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Dict, Any, Optional, List
+import psycopg2.extensions
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Sequence
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SQLite connection tuning: WAL lets readers run alongside a writer and, with
+# synchronous=NORMAL, costs one fsync per commit at checkpoints instead of two per
+# commit. Override or drop entries via config['database']['pragmas'].
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'mmap_size': 30000000000,
+    'cache_size': -64000,
+    'busy_timeout': 5000,
+    'wal_autocheckpoint': 1000
+}
+
+# Hot PostgreSQL reads prepared once per pooled connection, so repeated calls skip
+# parsing and planning. Executed through _stmts as EXECUTE name(...).
+POSTGRES_PREPARED = {
+    'incidents_all': "SELECT * FROM incidents ORDER BY created_at DESC LIMIT $1",
+    'incidents_by_status': "SELECT * FROM incidents WHERE status = $1 ORDER BY created_at DESC LIMIT $2"
+}
+
+# Tables created by the schema scripts; the only names table_sql will interpolate
+SCHEMA_TABLES = ('incidents', 'resources', 'settings', 'users', 'audit_log')
+
+# Bump whenever the schema scripts change so existing databases re-run them
+SCHEMA_VERSION = 3
+
+# Seconds between background connection probes behind is_connected
+HEARTBEAT_INTERVAL = 30
+
+def _heartbeat(manager_ref: 'weakref.ref', stop: threading.Event):
+    """Refresh a manager's connection state until it is closed or garbage collected."""
+    while not stop.wait(HEARTBEAT_INTERVAL):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager._connected = manager._probe()
+        del manager
+
+class _CopyRowStream(io.TextIOBase):
+    """
+    Read-only text stream that formats rows lazily as PostgreSQL COPY text format.
+    
+    Fields are tab-separated, NULL is \\N, and backslash, tab, newline and carriage
+    return are escaped. Only the rows needed to satisfy each read() are formatted.
+    """
+    
+    _ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+    
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = ''
+    
+    def readable(self) -> bool:
+        return True
+    
+    @classmethod
+    def _field(cls, value: Any) -> str:
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, default=str)
+        return str(value).translate(cls._ESCAPES)
+    
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer += '\t'.join(self._field(value) for value in row) + '\n'
+        
+        if size < 0:
+            data, self._buffer = self._buffer, ''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+    
+    def readline(self, size: int = -1) -> str:
+        # copy_expert only uses read(); one formatted row per line otherwise
+        return self.read(size)
+
 class DatabaseManager:
     """
     Unified database manager that works across different environments.
     Supports PostgreSQL (Replit/Azure) and SQLite (fallback).
     """
     
+    # Incident columns that update_incident may set
+    _INCIDENT_COLS = frozenset({
+        'title', 'description', 'status', 'priority', 'assignee',
+        'service', 'region', 'category', 'impact'
+    })
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.connection = None
         self.db_type = None
         self.logger = logging.getLogger(__name__)
         
+        # PostgreSQL connection pool (SQLite uses the single self.connection)
+        self._pool = None
+        # Serializes use of the shared SQLite connection across threads
+        self._sqlite_lock = threading.RLock()
+        self._pool_slots = None
+        # Creation time per pooled connection; keyed weakly on the connection object, since
+        # ids of connections the pool closes can be reused by new ones
+        self._conn_created = weakref.WeakKeyDictionary()
+        
+        # Placeholder style and statement templates for the connected backend, see _build_statements
+        self._ph = None
+        self._no_limit = None
+        self._stmts: Dict[str, str] = {}
+        # UPDATE statements per sorted tuple of incident columns, see update_incident
+        self._update_tmpl_cache: Dict[tuple, str] = {}
+        # Pooled PostgreSQL connections that already hold the POSTGRES_PREPARED statements
+        self._prepared_conns = weakref.WeakSet()
+        
+        # Per-thread cursors reused across calls, see _cursor
+        self._tl = threading.local()
+        
+        # Connection state kept current by the heartbeat thread, see is_connected
+        self._connected = False
+        self._heartbeat_stop = threading.Event()
+        
     def initialize(self) -> bool:
         """
         Initialize database connection and create schema if needed.
@@ -27,16 +158,29 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            # Try to connect to PostgreSQL first (Replit/Azure)
-            if self._connect_postgresql():
+            # Try to connect to PostgreSQL first (Replit/Azure). Only a configured server
+            # is worth waiting for; otherwise a single attempt decides and SQLite takes over
+            db_config = self.config.get('database', {})
+            attempts = int(db_config.get('connect_attempts', 5)) if self._postgres_configured() else 1
+            try:
+                connected = self._retry(self._connect_postgresql, attempts=attempts)
+            except Exception:
+                # Already logged by _connect_postgresql
+                connected = False
+            
+            if connected:
                 self.db_type = 'postgresql'
                 self._create_postgresql_schema()
+                self._build_statements()
+                self._start_heartbeat()
                 return True
             
             # Fallback to SQLite
             if self._connect_sqlite():
                 self.db_type = 'sqlite'
                 self._create_sqlite_schema()
+                self._build_statements()
+                self._start_heartbeat()
                 return True
             
             return False
@@ -45,20 +189,118 @@ class DatabaseManager:
             self.logger.error(f"Database initialization failed: {e}")
             return False
     
+    def ensure_schema(self) -> bool:
+        """
+        Create the schema on the current connection if it is missing or out of date.
+        
+        Unlike initialize(), this does not reconnect, so it is safe on the shared manager.
+        
+        Returns:
+            True if the schema is in place, False otherwise
+        """
+        try:
+            if self.db_type == 'postgresql':
+                self._create_postgresql_schema()
+            else:
+                self._create_sqlite_schema()
+            return True
+        except Exception as e:
+            self.logger.error(f"Schema initialization failed: {e}")
+            return False
+    
+    def _postgres_configured(self) -> bool:
+        """True if a PostgreSQL URL or a non-local host is configured (not just the localhost default)."""
+        db_config = self.config.get('database', {})
+        host = db_config.get('host') or ''
+        return bool(db_config.get('url')) or host not in ('', 'localhost', '127.0.0.1', '::1')
+    
+    def _retry(self, fn, attempts: int = 5, base: float = 0.1, cap: float = 2.0,
+               retry_on: tuple = (psycopg2.OperationalError,)):
+        """
+        Call a connect function, retrying transient failures with backoff.
+        
+        The delay doubles from base up to cap and is jittered by +/-50% so workers
+        restarting together do not reconnect in lockstep. Exceptions not in
+        retry_on, and the last attempt's failure, are raised.
+        
+        Args:
+            fn: Callable that raises on failure
+            attempts: Maximum number of calls
+            base: Delay after the first failure in seconds
+            cap: Upper bound on the un-jittered delay in seconds
+            retry_on: Exception types treated as transient
+            
+        Returns:
+            The result of the first successful call
+        """
+        attempts = max(1, attempts)
+        for i in range(attempts):
+            try:
+                return fn()
+            except retry_on:
+                if i == attempts - 1:
+                    raise
+                delay = min(cap, base * 2 ** i) * random.uniform(0.5, 1.5)
+                self.logger.info(f"Retrying database connection in {delay:.2f}s ({i + 1}/{attempts})")
+                time.sleep(delay)
+    
+    def _build_statements(self):
+        """Format the fixed queries once for the connected backend's placeholder style."""
+        ph = self._ph = '%s' if self.db_type == 'postgresql' else '?'
+        self._update_tmpl_cache.clear()
+        # LIMIT is always bound; this value means "no limit" (NULL in PostgreSQL, -1 in SQLite)
+        self._no_limit = None if self.db_type == 'postgresql' else -1
+        
+        incident_columns = ('incident_id, title, description, status, priority, '
+                            'assignee, service, region, category, impact')
+        
+        if self.db_type == 'postgresql':
+            incident_reads = {
+                'incidents_all': f"EXECUTE incidents_all({ph})",
+                'incidents_by_status': f"EXECUTE incidents_by_status({ph}, {ph})"
+            }
+        else:
+            incident_reads = {
+                'incidents_all': f"SELECT * FROM incidents ORDER BY created_at DESC LIMIT {ph}",
+                'incidents_by_status': f"SELECT * FROM incidents WHERE status = {ph} ORDER BY created_at DESC LIMIT {ph}"
+            }
+        
+        self._stmts = {
+            **incident_reads,
+            'create_incident': f"INSERT INTO incidents ({incident_columns}) VALUES ({', '.join([ph] * 10)})",
+            'get_setting': f"SELECT value FROM settings WHERE key = {ph}",
+            'set_setting': f"""
+                INSERT INTO settings (key, value, description) 
+                VALUES ({ph}, {ph}, {ph})
+                ON CONFLICT (key) DO UPDATE SET 
+                    value = EXCLUDED.value,
+                    description = EXCLUDED.description,
+                    updated_at = CURRENT_TIMESTAMP
+            """ if self.db_type == 'postgresql' else f"""
+                INSERT OR REPLACE INTO settings (key, value, description, updated_at)
+                VALUES ({ph}, {ph}, {ph}, CURRENT_TIMESTAMP)
+            """
+        }
+    
     def _connect_postgresql(self) -> bool:
-        """Connect to PostgreSQL database."""
+        """Create a PostgreSQL connection pool; raises if the server cannot be reached."""
         try:
             db_config = self.config.get('database', {})
+            pool_size = int(db_config.get('pool_size', 15))
+            max_overflow = int(db_config.get('max_overflow', 10))
+            maxconn = pool_size + max_overflow
             
             # Try DATABASE_URL first (Replit style)
             if db_config.get('url'):
-                self.connection = psycopg2.connect(
+                self._pool = ThreadedConnectionPool(
+                    pool_size, maxconn,
                     db_config['url'],
                     cursor_factory=RealDictCursor
                 )
             else:
                 # Build connection from components
-                self.connection = psycopg2.connect(
+                self._pool = ThreadedConnectionPool(
+                    pool_size, maxconn,
                     host=db_config.get('host', 'localhost'),
                     port=db_config.get('port', 5432),
                     database=db_config.get('database', 'azure_support'),
@@ -66,22 +308,131 @@ class DatabaseManager:
                     password=db_config.get('password', ''),
                     cursor_factory=RealDictCursor
                 )
+            # pool_size connections stay open between uses; the pool closes overflow connections
+            # (beyond minconn idle) as they are returned. It also fails fast when exhausted; the
+            # semaphore makes callers wait instead
+            self._pool_slots = threading.BoundedSemaphore(maxconn)
             
             # Test connection
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT 1')
-            cursor.fetchone()
-            cursor.close()
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+                cursor.close()
             
-            self.logger.info("Connected to PostgreSQL database")
+            self.logger.info(f"Connected to PostgreSQL database (pool size {pool_size}, max {maxconn})")
             return True
             
         except Exception as e:
             self.logger.error(f"PostgreSQL connection failed: {e}")
-            if self.connection:
-                self.connection.close()
-                self.connection = None
-            return False
+            if self._pool:
+                self._pool.closeall()
+                self._pool = None
+            raise
+    
+    def _checkout(self):
+        """Take a live connection from the pool, recycling stale or broken ones."""
+        db_config = self.config.get('database', {})
+        pool_timeout = float(db_config.get('pool_timeout', 30))
+        pool_recycle = float(db_config.get('pool_recycle', 1800))
+        pre_ping = db_config.get('pool_pre_ping', True)
+        
+        if not self._pool_slots.acquire(timeout=pool_timeout):
+            raise TimeoutError(f"No database connection available within {pool_timeout}s")
+        
+        try:
+            while True:
+                conn = self._pool.getconn()
+                created = self._conn_created.setdefault(conn, time.monotonic())
+                
+                if conn.closed or time.monotonic() - created > pool_recycle:
+                    self._discard(conn)
+                    continue
+                
+                if pre_ping:
+                    try:
+                        cursor = self._cursor(conn)
+                        cursor.execute('SELECT 1')
+                        cursor.fetchone()
+                        conn.rollback()
+                    except psycopg2.Error:
+                        self._discard(conn)
+                        continue
+                
+                # Statements can only be prepared once the schema exists (after _build_statements)
+                if self._stmts and conn not in self._prepared_conns:
+                    self._prepare(conn)
+                
+                return conn
+        except Exception:
+            self._pool_slots.release()
+            raise
+    
+    def _prepare(self, conn):
+        """Prepare POSTGRES_PREPARED on a pooled connection; prepared statements last for its session."""
+        try:
+            cursor = conn.cursor()
+            for name, query in POSTGRES_PREPARED.items():
+                cursor.execute(f"PREPARE {name} AS {query}")
+            cursor.close()
+            conn.commit()
+            self._prepared_conns.add(conn)
+        except psycopg2.Error:
+            self._discard(conn)
+            raise
+    
+    def _discard(self, conn):
+        """Close a pooled connection and forget its age."""
+        self._conn_created.pop(conn, None)
+        self._prepared_conns.discard(conn)
+        self._pool.putconn(conn, close=True)
+    
+    def _cursor(self, conn):
+        """
+        Get this thread's reusable cursor for a connection, creating it on first use.
+        
+        Cursors for connections that have since been closed are dropped when a
+        new one is created.
+        """
+        cursors = getattr(self._tl, 'cursors', None)
+        if cursors is None:
+            cursors = self._tl.cursors = {}
+        
+        cursor = cursors.get(id(conn))
+        if cursor is None or cursor.connection is not conn or getattr(cursor, 'closed', False):
+            for key in [k for k, c in cursors.items() if getattr(c.connection, 'closed', False)]:
+                del cursors[key]
+            cursor = cursors[id(conn)] = conn.cursor()
+        return cursor
+    
+    @contextmanager
+    def _conn(self):
+        """
+        Yield a database connection: pooled for PostgreSQL, shared (under a lock) for SQLite.
+        
+        Inside transaction() the thread's transaction connection is yielded instead.
+        """
+        tx_conn = getattr(self._tl, 'tx_conn', None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+        
+        if self._pool is None:
+            with self._sqlite_lock:
+                yield self.connection
+            return
+        
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            # putconn closes the connection itself once pool_size connections are idle;
+            # send those overflow connections through _discard so their state is dropped too
+            if conn.closed or len(self._pool._pool) >= self._pool.minconn:
+                self._discard(conn)
+            else:
+                self._pool.putconn(conn)
+            self._pool_slots.release()
     
     def _connect_sqlite(self) -> bool:
         """Connect to SQLite database (fallback)."""
@@ -89,8 +440,10 @@ class DatabaseManager:
             # Create data directory if it doesn't exist
             os.makedirs('data', exist_ok=True)
             
-            self.connection = sqlite3.connect('data/azure_support.db')
+            # The manager is shared across Streamlit sessions, which run on separate threads
+            self.connection = sqlite3.connect('data/azure_support.db', check_same_thread=False)
             self.connection.row_factory = sqlite3.Row
+            self._apply_sqlite_pragmas()
             
             # Test connection
             cursor = self.connection.cursor()
@@ -108,8 +461,33 @@ class DatabaseManager:
                 self.connection = None
             return False
     
+    def _apply_sqlite_pragmas(self):
+        """Apply SQLITE_PRAGMAS merged with any configured overrides (a None value skips a pragma)."""
+        pragmas = {**SQLITE_PRAGMAS, **(self.config.get('database', {}).get('pragmas') or {})}
+        script = ''.join(f"PRAGMA {name}={value};" for name, value in pragmas.items() if value is not None)
+        if script:
+            self.connection.executescript(script)
+    
+    def _schema_is_current(self) -> bool:
+        """Check the schema_version sentinel in settings; False if missing or the table does not exist."""
+        try:
+            with self._conn() as conn:
+                cursor = self._cursor(conn)
+                try:
+                    cursor.execute("SELECT value FROM settings WHERE key = 'schema_version'")
+                    row = cursor.fetchone()
+                finally:
+                    # Ends the read (or the failed) transaction on PostgreSQL
+                    conn.rollback()
+            return row is not None and str(row['value']).strip('"') == str(SCHEMA_VERSION)
+        except Exception:
+            return False
+    
     def _create_postgresql_schema(self):
-        """Create PostgreSQL database schema."""
+        """Create PostgreSQL database schema, unless the schema_version sentinel is current."""
+        if self._schema_is_current():
+            return
+        
         schema_sql = """
         -- Incidents table
         CREATE TABLE IF NOT EXISTS incidents (
@@ -177,20 +555,37 @@ class DatabaseManager:
         -- Create indexes
         CREATE INDEX IF NOT EXISTS idx_incidents_status ON incidents(status);
         CREATE INDEX IF NOT EXISTS idx_incidents_assignee ON incidents(assignee);
+        CREATE INDEX IF NOT EXISTS idx_incidents_created_at ON incidents(created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_incidents_status_created ON incidents(status, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_resources_type ON resources(type);
         CREATE INDEX IF NOT EXISTS idx_resources_rg ON resources(resource_group);
         CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp);
         """
+        schema_sql += f"""
+        INSERT INTO settings (key, value, description)
+        VALUES ('schema_version', '{SCHEMA_VERSION}', 'Schema script version')
+        ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP;
+        """
         
-        cursor = self.connection.cursor()
-        cursor.execute(schema_sql)
-        self.connection.commit()
-        cursor.close()
+        # One round trip inside a savepoint: a failing statement undoes only the DDL,
+        # leaving any enclosing transaction on the connection usable
+        with self._conn() as conn:
+            cursor = self._cursor(conn)
+            try:
+                cursor.execute(f"SAVEPOINT schema_create;{schema_sql}RELEASE SAVEPOINT schema_create;")
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT schema_create")
+                raise
+            if not self._in_transaction():
+                conn.commit()
         
         self.logger.info("PostgreSQL schema created successfully")
     
     def _create_sqlite_schema(self):
-        """Create SQLite database schema."""
+        """Create SQLite database schema, unless the schema_version sentinel is current."""
+        if self._schema_is_current():
+            return
+        
         schema_sql = """
         -- Incidents table
         CREATE TABLE IF NOT EXISTS incidents (
@@ -258,50 +653,159 @@ class DatabaseManager:
         -- Create indexes
         CREATE INDEX IF NOT EXISTS idx_incidents_status ON incidents(status);
         CREATE INDEX IF NOT EXISTS idx_incidents_assignee ON incidents(assignee);
+        CREATE INDEX IF NOT EXISTS idx_incidents_created_at ON incidents(created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_incidents_status_created ON incidents(status, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_resources_type ON resources(type);
         CREATE INDEX IF NOT EXISTS idx_resources_rg ON resources(resource_group);
         CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp);
         """
+        schema_sql += f"""
+        INSERT OR REPLACE INTO settings (key, value, description, updated_at)
+        VALUES ('schema_version', '{SCHEMA_VERSION}', 'Schema script version', CURRENT_TIMESTAMP);
+        """
         
-        cursor = self.connection.cursor()
-        cursor.executescript(schema_sql)
-        self.connection.commit()
-        cursor.close()
+        # executescript runs on the connection directly; BEGIN/COMMIT makes the script atomic
+        with self._conn() as conn:
+            try:
+                conn.executescript(f"BEGIN;{schema_sql}COMMIT;")
+            except Exception:
+                conn.rollback()
+                raise
         
         self.logger.info("SQLite schema created successfully")
     
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
+    def execute_query(self, query: str, params: Optional[tuple] = None, _to_dict: bool = False) -> List[Dict]:
         """
         Execute a SELECT query and return results.
         
+        Rows are returned as the driver produced them (RealDictRow on PostgreSQL,
+        sqlite3.Row on SQLite); both support row['column']. sqlite3.Row is read-only,
+        has no .get() and cannot be pickled, so pass _to_dict=True when the caller
+        needs any of those.
+        
         Args:
             query: SQL query string
             params: Query parameters
+            _to_dict: Convert each row to a plain dict
             
         Returns:
-            List of row dictionaries
+            List of rows
         """
         try:
-            cursor = self.connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            results = cursor.fetchall()
-            cursor.close()
+            with self._conn() as conn:
+                cursor = self._cursor(conn)
+                
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                results = cursor.fetchall()
+                
+                # Close the read transaction so pooled connections are not returned idle-in-transaction
+                if self.db_type == 'postgresql' and not self._in_transaction():
+                    conn.rollback()
             
-            # Convert to list of dictionaries
-            if self.db_type == 'postgresql':
-                return [dict(row) for row in results]
-            else:  # SQLite
+            if _to_dict:
                 return [dict(row) for row in results]
+            return results
                 
         except Exception as e:
             self.logger.error(f"Query execution failed: {e}")
             return []
     
+    @contextmanager
+    def stream_rows(self, query: str, params: Optional[tuple] = None, chunk: int = 5000):
+        """
+        Run a SELECT query and stream its rows as plain tuples.
+        
+        PostgreSQL uses a server-side (named) cursor that fetches `chunk` rows
+        per round-trip. The connection stays checked out (for SQLite, locked)
+        until the context exits.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunk: Rows fetched per round-trip
+            
+        Yields:
+            Tuple of (column names, iterator over row tuples)
+        """
+        with self._conn() as conn:
+            if self.db_type == 'postgresql':
+                cursor = conn.cursor(name=f"iter_{uuid.uuid4().hex}",
+                                     cursor_factory=psycopg2.extensions.cursor)
+                cursor.itersize = chunk
+            else:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.arraysize = chunk
+            
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                # A named cursor only reports its columns once the first rows are fetched
+                first = cursor.fetchmany(chunk)
+                columns = [d[0] for d in cursor.description]
+                
+                yield columns, itertools.chain(first, cursor)
+            finally:
+                cursor.close()
+                # Named cursors live inside a transaction; end it before the connection goes back
+                if self.db_type == 'postgresql' and not conn.closed and not self._in_transaction():
+                    conn.rollback()
+    
+    def iter_query(self, query: str, params: Optional[tuple] = None, chunk: int = 5000) -> Iterator[Dict]:
+        """
+        Stream the rows of a SELECT query without loading the full result.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunk: Rows fetched per round-trip
+            
+        Yields:
+            Row dictionaries
+        """
+        with self.stream_rows(query, params, chunk) as (columns, rows):
+            for row in rows:
+                yield dict(zip(columns, row))
+    
+    def _in_transaction(self) -> bool:
+        """Whether the current thread is inside transaction()."""
+        return getattr(self._tl, 'tx_conn', None) is not None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group several updates into one transaction with a single commit.
+        
+        execute_update and bulk_insert called by this thread inside the block
+        use the same connection and skip their own commit; a failure raises and
+        rolls back everything. Nested blocks join the outer transaction.
+        """
+        if self._in_transaction():
+            yield
+            return
+        
+        with self._conn() as conn:
+            if self.db_type == 'sqlite' and not conn.in_transaction:
+                conn.execute('BEGIN')
+            
+            self._tl.tx_conn = conn
+            try:
+                yield
+                conn.commit()
+            except Exception:
+                if not getattr(conn, 'closed', False):
+                    conn.rollback()
+                raise
+            finally:
+                self._tl.tx_conn = None
+    
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
         """
         Execute an INSERT, UPDATE, or DELETE query.
@@ -314,54 +818,180 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            cursor = self.connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            self.connection.commit()
-            cursor.close()
+            with self._conn() as conn:
+                try:
+                    cursor = self._cursor(conn)
+                    
+                    if params:
+                        cursor.execute(query, params)
+                    else:
+                        cursor.execute(query)
+                    
+                    if not self._in_transaction():
+                        conn.commit()
+                except Exception:
+                    if not self._in_transaction() and not getattr(conn, 'closed', False):
+                        conn.rollback()
+                    raise
             
             return True
             
         except Exception as e:
             self.logger.error(f"Update execution failed: {e}")
-            self.connection.rollback()
+            if self._in_transaction():
+                # Let transaction() roll back the whole unit of work
+                raise
             return False
     
-    def get_incidents(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
-        """Get incidents from database."""
-        query = "SELECT * FROM incidents"
-        params = None
+    def table_sql(self, template: str, table: str, columns: Sequence[str] = (), **identifiers: str):
+        """
+        Fill identifier placeholders in a statement template with quoted names.
         
-        if status:
-            query += " WHERE status = %s" if self.db_type == 'postgresql' else " WHERE status = ?"
-            params = (status,)
+        Args:
+            template: Statement with {table}, optionally {columns} and any extra named placeholders
+            table: Table name (must be one of SCHEMA_TABLES)
+            columns: Column names for {columns}
+            **identifiers: Single column names for the extra placeholders
+            
+        Returns:
+            psycopg2.sql.Composed on PostgreSQL, a plain string on SQLite
+        """
+        if table not in SCHEMA_TABLES:
+            raise ValueError(f"Unknown table: {table}")
         
-        query += " ORDER BY created_at DESC"
+        if self.db_type == 'postgresql':
+            return sql.SQL(template).format(
+                table=sql.Identifier(table),
+                columns=sql.SQL(', ').join(sql.Identifier(c) for c in columns),
+                **{key: sql.Identifier(name) for key, name in identifiers.items()}
+            )
         
-        if limit:
-            query += f" LIMIT {limit}"
+        def quote(name: str) -> str:
+            return '"' + name.replace('"', '""') + '"'
         
-        return self.execute_query(query, params)
+        return template.format(
+            table=quote(table),
+            columns=', '.join(quote(c) for c in columns),
+            **{key: quote(name) for key, name in identifiers.items()}
+        )
+    
+    def bulk_insert(self, table: str, columns: List[str], rows: List[tuple],
+                    on_conflict: Optional[str] = None) -> Optional[int]:
+        """
+        Insert many rows in a single transaction.
+        
+        Args:
+            table: Target table name
+            columns: Column names, in the order of each row's values
+            rows: Row value tuples
+            on_conflict: Unique column; rows that collide on it are skipped instead of failing
+            
+        Returns:
+            Number of rows inserted (skipped rows are not counted), or None on failure
+            (nothing is inserted)
+        """
+        if not rows:
+            return 0
+        
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                try:
+                    if self.db_type == 'postgresql':
+                        # One multi-row INSERT per page instead of one round-trip per row
+                        if on_conflict:
+                            statement = self.table_sql(
+                                "INSERT INTO {table} ({columns}) VALUES %s ON CONFLICT ({conflict}) DO NOTHING",
+                                table, columns, conflict=on_conflict
+                            )
+                        else:
+                            statement = self.table_sql("INSERT INTO {table} ({columns}) VALUES %s", table, columns)
+                        # execute_values only reports the last page's rowcount, so page here and sum
+                        inserted = 0
+                        for start in range(0, len(rows), 1000):
+                            execute_values(cursor, statement, rows[start:start + 1000], page_size=1000)
+                            inserted += cursor.rowcount
+                    else:
+                        placeholders = ', '.join(['?'] * len(columns))
+                        verb = 'INSERT OR IGNORE' if on_conflict else 'INSERT'
+                        statement = self.table_sql(verb + " INTO {table} ({columns}) VALUES (" + placeholders + ")",
+                                                   table, columns)
+                        cursor.executemany(statement, rows)
+                        inserted = cursor.rowcount
+                    
+                    if not self._in_transaction():
+                        conn.commit()
+                except Exception:
+                    if not self._in_transaction() and not getattr(conn, 'closed', False):
+                        conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            
+            return inserted
+            
+        except Exception as e:
+            self.logger.error(f"Bulk insert into {table} failed: {e}")
+            if self._in_transaction():
+                # Let transaction() roll back the whole unit of work
+                raise
+            return None
+    
+    def bulk_copy_postgres(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> bool:
+        """
+        Load rows into a PostgreSQL table with COPY FROM STDIN.
+        
+        Rows are formatted as COPY text lazily while libpq reads the stream,
+        so `rows` can be any iterable and is never materialized as a whole.
+        
+        Args:
+            table: Target table name
+            columns: Column names, in the order of each row's values
+            rows: Row value sequences
+            
+        Returns:
+            True if all rows were loaded, False otherwise (nothing is loaded)
+        """
+        if self.db_type != 'postgresql':
+            raise ValueError("COPY is only available for PostgreSQL")
+        
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.copy_expert(
+                        self.table_sql("COPY {table} ({columns}) FROM STDIN WITH (FORMAT text)", table, columns),
+                        _CopyRowStream(rows)
+                    )
+                    
+                    if not self._in_transaction():
+                        conn.commit()
+                except Exception:
+                    if not self._in_transaction() and not getattr(conn, 'closed', False):
+                        conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"COPY into {table} failed: {e}")
+            if self._in_transaction():
+                # Let transaction() roll back the whole unit of work
+                raise
+            return False
+    
+    def get_incidents(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Get incidents from database (as plain dicts, since they are passed on to pages and exports)."""
+        limit = limit or self._no_limit
+        
+        if status:
+            return self.execute_query(self._stmts['incidents_by_status'], (status, limit), _to_dict=True)
+        return self.execute_query(self._stmts['incidents_all'], (limit,), _to_dict=True)
     
     def create_incident(self, incident_data: Dict[str, Any]) -> bool:
         """Create a new incident."""
-        if self.db_type == 'postgresql':
-            query = """
-                INSERT INTO incidents (incident_id, title, description, status, priority, 
-                                     assignee, service, region, category, impact)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-        else:
-            query = """
-                INSERT INTO incidents (incident_id, title, description, status, priority,
-                                     assignee, service, region, category, impact)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-        
         params = (
             incident_data.get('incident_id'),
             incident_data.get('title'),
@@ -375,47 +1005,37 @@ class DatabaseManager:
             incident_data.get('impact')
         )
         
-        return self.execute_update(query, params)
+        return self.execute_update(self._stmts['create_incident'], params)
     
     def update_incident(self, incident_id: str, update_data: Dict[str, Any]) -> bool:
         """Update an existing incident."""
-        set_clauses = []
-        params = []
-        
-        for key, value in update_data.items():
-            if key != 'incident_id':  # Don't update the ID
-                set_clauses.append(f"{key} = %s" if self.db_type == 'postgresql' else f"{key} = ?")
-                params.append(value)
+        # Only known columns are ever interpolated into the SQL
+        unknown = update_data.keys() - self._INCIDENT_COLS - {'incident_id'}
+        if unknown:
+            self.logger.warning(f"Ignoring unknown incident fields: {', '.join(sorted(unknown))}")
         
-        if not set_clauses:
+        keys = tuple(sorted(update_data.keys() & self._INCIDENT_COLS))
+        if not keys:
             return False
         
-        # Add updated_at
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(incident_id)
+        query = self._update_tmpl_cache.get(keys)
+        if query is None:
+            set_clause = ', '.join(f"{key} = {self._ph}" for key in keys)
+            query = f"UPDATE incidents SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE incident_id = {self._ph}"
+            self._update_tmpl_cache[keys] = query
         
-        query = f"""
-            UPDATE incidents 
-            SET {', '.join(set_clauses)}
-            WHERE incident_id = %s
-        """ if self.db_type == 'postgresql' else f"""
-            UPDATE incidents 
-            SET {', '.join(set_clauses)}
-            WHERE incident_id = ?
-        """
-        
-        return self.execute_update(query, tuple(params))
+        params = tuple(update_data[key] for key in keys) + (incident_id,)
+        return self.execute_update(query, params)
     
     def get_setting(self, key: str) -> Optional[Dict[str, Any]]:
         """Get a setting value."""
-        query = "SELECT value FROM settings WHERE key = %s" if self.db_type == 'postgresql' else "SELECT value FROM settings WHERE key = ?"
-        results = self.execute_query(query, (key,))
+        results = self.execute_query(self._stmts['get_setting'], (key,))
         
         if results:
             value = results[0]['value']
             if isinstance(value, str):
                 try:
-                    return json.loads(value)
+                    return orjson.loads(value) if orjson else json.loads(value)
                 except json.JSONDecodeError:
                     return value
             return value
@@ -425,47 +1045,80 @@ class DatabaseManager:
     def set_setting(self, key: str, value: Any, description: Optional[str] = None) -> bool:
         """Set a setting value."""
         # Convert value to JSON string for SQLite
-        json_value = json.dumps(value) if self.db_type == 'sqlite' else value
-        
-        if self.db_type == 'postgresql':
-            query = """
-                INSERT INTO settings (key, value, description) 
-                VALUES (%s, %s, %s)
-                ON CONFLICT (key) DO UPDATE SET 
-                    value = EXCLUDED.value,
-                    description = EXCLUDED.description,
-                    updated_at = CURRENT_TIMESTAMP
-            """
+        if self.db_type == 'sqlite':
+            json_value = orjson.dumps(value).decode() if orjson else json.dumps(value)
         else:
-            query = """
-                INSERT OR REPLACE INTO settings (key, value, description, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """
+            json_value = value
         
-        return self.execute_update(query, (key, json_value, description))
+        return self.execute_update(self._stmts['set_setting'], (key, json_value, description))
     
     def close(self):
         """Close database connection."""
+        self._heartbeat_stop.set()
+        self._connected = False
+        if self._pool:
+            self._pool.closeall()
+            self._pool = None
+            self._conn_created.clear()
+            self._prepared_conns.clear()
+            self.logger.info("Database connection pool closed")
         if self.connection:
+            try:
+                # Let SQLite refresh query planner statistics gathered during this connection
+                self.connection.execute('PRAGMA optimize')
+            except sqlite3.Error as e:
+                self.logger.warning(f"PRAGMA optimize failed: {e}")
             self.connection.close()
             self.connection = None
             self.logger.info("Database connection closed")
     
     def is_connected(self) -> bool:
-        """Check if database is connected."""
+        """
+        Check if database is connected.
+        
+        Answers from local state without a database round-trip: the manager
+        must still hold an open pool (PostgreSQL) or connection (SQLite), and
+        the last heartbeat probe, at most HEARTBEAT_INTERVAL seconds old, must
+        have succeeded.
+        """
+        if self.db_type == 'postgresql':
+            open_handle = self._pool is not None and not self._pool.closed
+        else:
+            open_handle = self.connection is not None
+        
+        return open_handle and self._connected
+    
+    def _probe(self) -> bool:
+        """Run a SELECT 1 round-trip to check the connection."""
         try:
-            if not self.connection:
+            if not self.connection and not self._pool:
                 return False
             
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT 1')
-            cursor.fetchone()
-            cursor.close()
+            with self._conn() as conn:
+                cursor = self._cursor(conn)
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+                if self.db_type == 'postgresql':
+                    conn.rollback()
             return True
             
         except Exception:
             return False
     
+    def _start_heartbeat(self):
+        """Mark the database connected and start the background probe thread."""
+        self._connected = True
+        self._heartbeat_stop.clear()
+        
+        # The thread holds only a weak reference so it does not keep the manager alive
+        thread = threading.Thread(
+            target=_heartbeat,
+            args=(weakref.ref(self), self._heartbeat_stop),
+            name='db-heartbeat',
+            daemon=True
+        )
+        thread.start()
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Get database health status."""
         status = {
@@ -492,7 +1145,7 @@ class DatabaseManager:
                         WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
                     """
                 
-                results = self.execute_query(query)
+                results = self.execute_query(query, _to_dict=True)
                 status['tables'] = results
                 
             except Exception as e:
@@ -5,9 +5,50 @@ Migrate data between Replit PostgreSQL and Databricks SQL.
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime
-from db_manager import DatabaseManager
+from .db_manager import DatabaseManager, SCHEMA_TABLES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for importing large backups
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Tables covered by export, migration and validation
+EXPORT_TABLES = SCHEMA_TABLES
+
+# Unique column per table; rows already present in the target are skipped so
+# an interrupted migration or import can simply be re-run
+_TABLE_UNIQUE = {
+    'incidents': 'incident_id',
+    'resources': 'resource_id',
+    'settings': 'key',
+    'users': 'username',
+    'audit_log': None
+}
+
+# Rows per bulk insert when streaming a backup in with ijson
+IMPORT_BATCH_SIZE = 1000
+
+def _json_default(obj):
+    """Serialize datetimes as ISO 8601 and anything else as its string form."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+def _dumps(obj: Any) -> str:
+    """Encode one value as JSON, with orjson when available (it handles datetimes natively)."""
+    if orjson:
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, default=_json_default)
 
 class DatabaseMigration:
     """Handle database migration between environments."""
@@ -17,33 +58,38 @@ class DatabaseMigration:
         self.target_db = target_db
         self.logger = logging.getLogger(__name__)
     
-    def export_data(self) -> Dict[str, List[Dict[str, Any]]]:
+    def export_data(self) -> Dict[str, Dict[str, Any]]:
         """
         Export all data from source database.
         
+        Tables are read concurrently, each on its own pooled connection.
+        
         Returns:
-            Dictionary of {table_name: [row_dicts]}
+            Dictionary of {table_name: {'columns': [names], 'rows': [value_lists]}}
         """
-        export_data = {}
-        
-        tables = ['incidents', 'resources', 'settings', 'users', 'audit_log']
-        
-        for table in tables:
-            try:
-                query = f"SELECT * FROM {table}"
-                rows = self.source_db.execute_query(query)
-                export_data[table] = rows
-                self.logger.info(f"Exported {len(rows)} rows from {table}")
-            except Exception as e:
-                self.logger.error(f"Failed to export {table}: {e}")
-                export_data[table] = []
-        
-        return export_data
+        with ThreadPoolExecutor(max_workers=len(EXPORT_TABLES)) as executor:
+            futures = {table: executor.submit(self._dump_table, table) for table in EXPORT_TABLES}
+            return {table: future.result() for table, future in futures.items()}
+    
+    def _dump_table(self, table: str) -> Dict[str, Any]:
+        """Read one table in the column-wise export layout (empty on failure)."""
+        try:
+            query = self.source_db.table_sql("SELECT * FROM {table}", table)
+            with self.source_db.stream_rows(query) as (columns, rows):
+                data = {'columns': columns, 'rows': list(rows)}
+            self.logger.info(f"Exported {len(data['rows'])} rows from {table}")
+            return data
+        except Exception as e:
+            self.logger.error(f"Failed to export {table}: {e}")
+            return {'columns': [], 'rows': []}
     
     def export_to_json(self, filepath: str) -> bool:
         """
         Export database to JSON file.
         
+        Each table is written column-wise as {"columns": [...], "rows": [[...], ...]}
+        so column names are stored once rather than once per row.
+        
         Args:
             filepath: Path to save JSON file
             
@@ -51,22 +97,27 @@ class DatabaseMigration:
             True if successful, False otherwise
         """
         try:
-            data = self.export_data()
-            
-            # Convert datetime objects to strings
-            def convert_datetime(obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return obj
-            
-            # Process each table's data
-            for table, rows in data.items():
-                for row in rows:
-                    for key, value in row.items():
-                        row[key] = convert_datetime(value)
-            
+            # Stream each table straight to the file so only one chunk of rows is in memory
             with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+                f.write('{')
+                for t, table in enumerate(EXPORT_TABLES):
+                    f.write(f'{"," if t else ""}\n  {_dumps(table)}: {{')
+                    count = 0
+                    columns = []
+                    try:
+                        query = self.source_db.table_sql("SELECT * FROM {table}", table)
+                        with self.source_db.stream_rows(query) as (columns, rows):
+                            f.write(f'"columns": {_dumps(columns)}, "rows": [')
+                            for row in rows:
+                                f.write(f'{"," if count else ""}\n    {_dumps(row)}')
+                                count += 1
+                    except Exception as e:
+                        self.logger.error(f"Failed to export {table}: {e}")
+                        if not columns:
+                            f.write('"columns": [], "rows": [')
+                    f.write('\n  ]}')
+                    self.logger.info(f"Exported {count} rows from {table}")
+                f.write('\n}\n')
             
             self.logger.info(f"Database exported to {filepath}")
             return True
@@ -79,6 +130,9 @@ class DatabaseMigration:
         """
         Import database from JSON file.
         
+        Accepts the column-wise layout written by export_to_json as well as
+        older backups that store each table as a list of row objects.
+        
         Args:
             filepath: Path to JSON file
             
@@ -90,13 +144,26 @@ class DatabaseMigration:
             return False
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if ijson:
+                ok = self._stream_import(filepath)
+            else:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson else json.load(f)
+                
+                # Import data to target database
+                ok = True
+                for table, table_data in data.items():
+                    if isinstance(table_data, list):
+                        # Legacy layout: list of row dictionaries
+                        columns = list(table_data[0]) if table_data else []
+                        rows = [[row.get(column) for column in columns] for row in table_data]
+                    else:
+                        columns, rows = table_data['columns'], table_data['rows']
+                    ok = self._import_rows(table, columns, rows) and ok
             
-            # Import data to target database
-            for table, rows in data.items():
-                for row in rows:
-                    self._import_row(table, row)
+            if not ok:
+                self.logger.error(f"Import from {filepath} finished with errors")
+                return False
             
             self.logger.info(f"Database imported from {filepath}")
             return True
@@ -105,6 +172,124 @@ class DatabaseMigration:
             self.logger.error(f"Import from JSON failed: {e}")
             return False
     
+    def _stream_import(self, filepath: str) -> bool:
+        """
+        Import a JSON backup in a single pass without loading the whole file.
+        
+        Parse events from ijson are dispatched on the top-level table key;
+        rows are built one at a time and inserted in batches of
+        IMPORT_BATCH_SIZE, so memory use is bounded by one batch.
+        
+        Args:
+            filepath: Path to JSON file
+            
+        Returns:
+            True if every batch was imported, False otherwise
+        """
+        ok = True
+        
+        with open(filepath, 'rb') as f:
+            events = ijson.parse(f, use_float=True)
+            for prefix, event, value in events:
+                # Only the top-level keys name tables
+                if prefix != '' or event != 'map_key':
+                    continue
+                
+                table = value
+                _, event, value = next(events)
+                if event == 'start_map':
+                    columns, rows = self._columnar_rows(events, table)
+                elif event == 'start_array':
+                    # Legacy layout: list of row dictionaries
+                    columns, rows = self._legacy_rows(events)
+                else:
+                    continue
+                
+                count = 0
+                while True:
+                    batch = list(itertools.islice(rows, IMPORT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    ok = self._import_rows(table, columns, batch) and ok
+                    count += len(batch)
+
+                self.logger.info(f"Imported {count} rows into {table}")
+        
+        return ok
+    
+    @staticmethod
+    def _build_value(events, event: str, value: Any) -> Any:
+        """Build one JSON value from the parse events, starting at its first event."""
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        depth = 1 if event in ('start_map', 'start_array') else 0
+        while depth:
+            _, event, value = next(events)
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+        return builder.value
+    
+    def _array_items(self, events):
+        """Yield each item of the array whose start_array event was just consumed."""
+        while True:
+            _, event, value = next(events)
+            if event == 'end_array':
+                return
+            yield self._build_value(events, event, value)
+    
+    def _columnar_rows(self, events, table: str):
+        """
+        Read the {"columns": [...], "rows": [...]} section of a table.
+        
+        Returns:
+            Tuple of (column names, iterator over row lists)
+        """
+        columns = None
+        while True:
+            _, event, value = next(events)
+            if event == 'end_map':
+                return columns or [], iter(())
+            
+            key = value
+            _, event, value = next(events)
+            if key == 'columns':
+                columns = self._build_value(events, event, value)
+            elif key == 'rows' and event == 'start_array':
+                if columns is None:
+                    raise ValueError(f"Rows of {table} appear before its columns")
+                return columns, self._columnar_tail(events)
+            else:
+                self._build_value(events, event, value)
+    
+    def _columnar_tail(self, events):
+        """Yield the rows of a columnar table, then consume the rest of its section."""
+        yield from self._array_items(events)
+        while True:
+            _, event, value = next(events)
+            if event == 'end_map':
+                return
+            _, event, value = next(events)
+            self._build_value(events, event, value)
+    
+    def _legacy_rows(self, events):
+        """
+        Read a legacy table section (a list of row objects).
+        
+        Returns:
+            Tuple of (column names from the first row, iterator over row lists)
+        """
+        records = self._array_items(events)
+        first = next(records, None)
+        if first is None:
+            return [], iter(())
+        columns = list(first)
+        rows = ([record.get(column) for column in columns]
+                for record in itertools.chain([first], records))
+        return columns, rows
+    
     def migrate_to_target(self) -> Dict[str, Any]:
         """
         Migrate data from source to target database.
@@ -119,46 +304,49 @@ class DatabaseMigration:
             'start_time': datetime.now().isoformat(),
             'tables': {},
             'total_rows': 0,
+            'skipped_rows': 0,
             'errors': []
         }
         
         # Export data from source
         data = self.export_data()
         
-        # Import to target
-        for table, rows in data.items():
-            success_count = 0
-            error_count = 0
+        # Import to target, one bulk insert per table
+        for table, table_data in data.items():
+            rows = table_data['rows']
             
-            for row in rows:
-                try:
-                    if self._import_row(table, row):
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    error_count += 1
-                    stats['errors'].append(f"{table}: {str(e)}")
+            try:
+                # One commit per table; a failure rolls the whole table back
+                with self.target_db.transaction():
+                    success_count = self._insert_rows(table, table_data['columns'], rows)
+                # Rows already present in the target (e.g. on a re-run) are skipped, not migrated
+                skipped_count, error_count = len(rows) - success_count, 0
+            except Exception as e:
+                success_count, skipped_count, error_count = 0, 0, len(rows)
+                stats['errors'].append(f"{table}: {str(e)}")
             
             stats['tables'][table] = {
                 'total': len(rows),
                 'success': success_count,
+                'skipped': skipped_count,
                 'errors': error_count
             }
             stats['total_rows'] += success_count
+            stats['skipped_rows'] += skipped_count
         
         stats['end_time'] = datetime.now().isoformat()
         stats['status'] = 'completed' if not stats['errors'] else 'completed_with_errors'
         
         return stats
     
-    def _import_row(self, table: str, row: Dict[str, Any]) -> bool:
+    def _import_rows(self, table: str, columns: List[str], rows: List[Sequence[Any]]) -> bool:
         """
-        Import a single row to target database.
+        Import all rows of a table to the target database in one transaction.
         
         Args:
             table: Table name
-            row: Row data dictionary
+            columns: Column names, in row value order
+            rows: Row value sequences
             
         Returns:
             True if successful, False otherwise
@@ -167,29 +355,43 @@ class DatabaseMigration:
             return False
         
         try:
-            # Remove id field (will be auto-generated)
-            row_data = {k: v for k, v in row.items() if k != 'id'}
-            
-            # Build INSERT query
-            columns = list(row_data.keys())
-            values = list(row_data.values())
-            
-            if self.target_db.db_type == 'postgresql':
-                placeholders = ', '.join(['%s'] * len(columns))
-            else:
-                placeholders = ', '.join(['?'] * len(columns))
-            
-            query = f"""
-                INSERT INTO {table} ({', '.join(columns)})
-                VALUES ({placeholders})
-            """
-            
-            return self.target_db.execute_update(query, tuple(values))
+            with self.target_db.transaction():
+                self._insert_rows(table, columns, rows)
+            return True
             
         except Exception as e:
-            self.logger.error(f"Failed to import row to {table}: {e}")
+            self.logger.error(f"Failed to import rows to {table}: {e}")
             return False
     
+    def _insert_rows(self, table: str, columns: List[str], rows: List[Sequence[Any]]) -> int:
+        """
+        Bulk insert rows into the target database, dropping the id column.
+        
+        Rows whose unique key already exists in the target are skipped.
+        
+        Raises on failure; call inside target_db.transaction().
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        # Remove id field (will be auto-generated)
+        keep = [i for i, column in enumerate(columns) if column != 'id']
+        if len(keep) == len(columns):
+            values = [tuple(row) for row in rows]
+        else:
+            values = [tuple(row[i] for i in keep) for row in rows]
+        
+        target_columns = [columns[i] for i in keep]
+        unique = _TABLE_UNIQUE.get(table)
+        if self.target_db.db_type == 'postgresql' and not unique:
+            # COPY streams rows through PostgreSQL's bulk load path, but cannot skip conflicts
+            self.target_db.bulk_copy_postgres(table, target_columns, values)
+            return len(values)
+        return self.target_db.bulk_insert(table, target_columns, values, on_conflict=unique)
+    
     def validate_migration(self) -> Dict[str, Any]:
         """
         Validate migration by comparing row counts.
@@ -205,12 +407,18 @@ class DatabaseMigration:
             'tables': {}
         }
         
-        tables = ['incidents', 'resources', 'settings', 'users', 'audit_log']
+        # Counts on independent tables (and databases) are I/O-bound, so run them together
+        with ThreadPoolExecutor(max_workers=len(EXPORT_TABLES) * 2) as executor:
+            futures = {
+                table: (executor.submit(self._count_rows, self.source_db, table),
+                        executor.submit(self._count_rows, self.target_db, table))
+                for table in EXPORT_TABLES
+            }
         
-        for table in tables:
+        for table, (source_future, target_future) in futures.items():
             try:
-                source_count = len(self.source_db.execute_query(f"SELECT COUNT(*) as count FROM {table}"))
-                target_count = len(self.target_db.execute_query(f"SELECT COUNT(*) as count FROM {table}"))
+                source_count = source_future.result()
+                target_count = target_future.result()
                 
                 match = source_count == target_count
                 
@@ -231,6 +439,14 @@ class DatabaseMigration:
         
         return results
     
+    @staticmethod
+    def _count_rows(db: DatabaseManager, table: str) -> int:
+        """Row count of a table; raises if the count query fails."""
+        results = db.execute_query(db.table_sql("SELECT COUNT(*) AS count FROM {table}", table))
+        if not results:
+            raise Exception(f"Could not count rows in {table}")
+        return int(results[0]['count'])
+    
     def create_backup(self, backup_name: Optional[str] = None) -> str:
         """
         Create a backup of the current database.
@@ -5,172 +5,278 @@ Handles detection of Replit, Databricks, and local environments.
 
 import os
 import sys
+import copy
 import platform
+import functools
 from typing import Dict, Any, Optional
 
+# Environment variable -> environment it indicates, in order of precedence
+_DETECT_KEYS = {
+    'REPL_ID': 'replit',
+    'REPL_SLUG': 'replit',
+    'DATABRICKS_RUNTIME_VERSION': 'databricks',
+    'SPARK_HOME': 'databricks',
+    'CODESPACE_NAME': 'codespace',
+    'GITPOD_WORKSPACE_ID': 'gitpod'
+}
+
+@functools.lru_cache(maxsize=1)
 def detect_environment() -> str:
     """
     Detect the current runtime environment.
     
+    The result is cached for the life of the process; call
+    detect_environment.cache_clear() after changing the environment variables.
+    
     Returns:
-        Environment string: 'replit', 'databricks', or 'local'
+        Environment string: 'replit', 'databricks', 'codespace', 'gitpod', or 'local'
     """
-    # Check for Replit environment
-    if "REPL_ID" in os.environ or "REPL_SLUG" in os.environ:
-        return "replit"
-    
-    # Check for Databricks environment
-    if "DATABRICKS_RUNTIME_VERSION" in os.environ or "SPARK_HOME" in os.environ:
-        return "databricks"
-    
-    # Check for other cloud environments
-    if "CODESPACE_NAME" in os.environ:
-        return "codespace"
+    env = os.environ
+    return next((env_type for key, env_type in _DETECT_KEYS.items() if key in env), 'local')
+
+def _build_replit_info(base_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Static environment details for Replit."""
+    return {
+        **base_info,
+        'name': 'Replit',
+        'status': '🟢 Active',
+        'detection_method': 'REPL_ID environment variable',
+        'features': [
+            'Built-in PostgreSQL database',
+            'Automatic HTTPS',
+            'Real-time collaboration',
+            'Package management',
+            'Secrets management'
+        ],
+        'limitations': [
+            'Resource limits apply',
+            'Always-on requires subscription',
+            'Storage limitations'
+        ],
+        'database_type': 'PostgreSQL (Managed)'
+    }
+
+def _replit_live_info() -> Dict[str, Any]:
+    """Replit details read from the environment on every call."""
+    env = os.environ
     
-    if "GITPOD_WORKSPACE_ID" in os.environ:
-        return "gitpod"
+    return {
+        'version': env.get('REPL_LANGUAGE_VERSION', 'Unknown'),
+        'config_path': env.get('REPL_HOME', '/home/runner'),
+        'environment_variables': {
+            'REPL_ID': env.get('REPL_ID'),
+            'REPL_SLUG': env.get('REPL_SLUG'),
+            'REPL_OWNER': env.get('REPL_OWNER')
+        }
+    }
+
+def _build_databricks_info(base_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Static environment details for Databricks."""
+    return {
+        **base_info,
+        'name': 'Databricks',
+        'status': '🔵 Active',
+        'detection_method': 'DATABRICKS_RUNTIME_VERSION environment variable',
+        'features': [
+            'Spark integration',
+            'Databricks SQL Warehouse',
+            'MLflow integration',
+            'Delta Lake support',
+            'Collaborative notebooks'
+        ],
+        'limitations': [
+            'Cluster startup time',
+            'Compute costs when running',
+            'Session timeouts'
+        ],
+        'config_path': '/databricks/driver',
+        'database_type': 'Databricks SQL'
+    }
+
+def _databricks_live_info() -> Dict[str, Any]:
+    """Databricks details read from the environment on every call."""
+    env = os.environ
+    
+    return {
+        'version': env.get('DATABRICKS_RUNTIME_VERSION', 'Unknown'),
+        'cluster_info': {
+            'cluster_id': env.get('DATABRICKS_CLUSTER_ID'),
+            'spark_version': env.get('SPARK_VERSION'),
+            'node_type': env.get('DATABRICKS_NODE_TYPE')
+        }
+    }
+
+def _build_codespace_info(base_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Static environment details for GitHub Codespace."""
+    return {
+        **base_info,
+        'name': 'GitHub Codespace',
+        'status': '🟢 Active',
+        'version': 'Latest',
+        'detection_method': 'CODESPACE_NAME environment variable',
+        'features': [
+            'VS Code in browser',
+            'GitHub integration',
+            'Port forwarding',
+            'Extensions support'
+        ],
+        'limitations': [
+            'Usage quotas apply',
+            'Automatic shutdown',
+            'Storage limitations'
+        ],
+        'config_path': '/workspaces',
+        'database_type': 'SQLite (default)'
+    }
+
+def _build_gitpod_info(base_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Static environment details for Gitpod."""
+    return {
+        **base_info,
+        'name': 'Gitpod',
+        'status': '🟢 Active', 
+        'version': 'Latest',
+        'detection_method': 'GITPOD_WORKSPACE_ID environment variable',
+        'features': [
+            'VS Code or Theia',
+            'Git integration',
+            'Prebuilds support',
+            'Port forwarding'
+        ],
+        'limitations': [
+            'Workspace timeout',
+            'Storage limitations',
+            'Usage quotas'
+        ],
+        'config_path': '/workspace',
+        'database_type': 'SQLite (default)'
+    }
+
+def _build_local_info(base_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Static environment details for local development."""
+    return {
+        **base_info,
+        'name': 'Local Development',
+        'status': '🟡 Local',
+        'version': 'Custom',
+        'detection_method': 'Default (no cloud indicators)',
+        'features': [
+            'Full system access',
+            'Custom database setup',
+            'Development tools',
+            'No usage limits'
+        ],
+        'limitations': [
+            'Manual configuration required',
+            'No automatic scaling',
+            'Local network only'
+        ],
+        'database_type': 'PostgreSQL or SQLite'
+    }
+
+def _local_live_info() -> Dict[str, Any]:
+    """Local details that can change while the process runs."""
+    return {'config_path': os.getcwd()}
+
+# Environment type -> builder for its static get_environment_info details
+_INFO_BUILDERS = {
+    'replit': _build_replit_info,
+    'databricks': _build_databricks_info,
+    'codespace': _build_codespace_info,
+    'gitpod': _build_gitpod_info
+}
+
+# Environment type -> details merged in after the cache (environment reads and the cwd)
+_LIVE_INFO = {
+    'replit': _replit_live_info,
+    'databricks': _databricks_live_info,
+    'local': _local_live_info
+}
+
+@functools.lru_cache(maxsize=8)
+def _static_environment_info(env_type: str) -> Dict[str, Any]:
+    """Platform and per-environment details that do not change while the process runs."""
+    base_info = {
+        'type': env_type,
+        'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        'platform': platform.platform(),
+        'architecture': platform.architecture()[0]
+    }
     
-    # Default to local
-    return "local"
+    return _INFO_BUILDERS.get(env_type, _build_local_info)(base_info)
 
 def get_environment_info(env_type: str) -> Dict[str, Any]:
     """
     Get detailed information about the current environment.
     
+    The static details are cached per environment type; values read from
+    environment variables are refreshed on every call.
+    
     Args:
         env_type: Environment type from detect_environment()
         
     Returns:
         Dictionary with environment details
     """
-    base_info = {
-        'type': env_type,
-        'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-        'platform': platform.platform(),
-        'architecture': platform.architecture()[0]
+    info = dict(_static_environment_info(env_type))
+    # Unknown types are reported as local, so they take the local live details too
+    live = _LIVE_INFO.get(env_type if env_type in _INFO_BUILDERS else 'local')
+    if live:
+        info.update(live())
+    return info
+
+def _build_replit_database_config() -> Dict[str, Any]:
+    """Database configuration for Replit."""
+    env = os.environ
+    
+    # Replit provides managed PostgreSQL
+    return {
+        'type': 'postgresql',
+        'host': env.get('PGHOST'),
+        'port': int(env.get('PGPORT', '5432')),
+        'database': env.get('PGDATABASE'),
+        'username': env.get('PGUSER'),
+        'password': env.get('PGPASSWORD'),
+        'url': env.get('DATABASE_URL'),
+        'ssl_mode': 'require',
+        'managed': True
+    }
+
+def _build_databricks_database_config() -> Dict[str, Any]:
+    """Database configuration for Databricks."""
+    env = os.environ
+    
+    # Databricks SQL Warehouse
+    return {
+        'type': 'databricks_sql',
+        'server_hostname': env.get('DATABRICKS_SERVER_HOSTNAME'),
+        'http_path': env.get('DATABRICKS_HTTP_PATH'),
+        'access_token': env.get('DATABRICKS_ACCESS_TOKEN'),
+        'managed': True
     }
-    
-    if env_type == "replit":
-        return {
-            **base_info,
-            'name': 'Replit',
-            'status': '🟢 Active',
-            'version': os.getenv('REPL_LANGUAGE_VERSION', 'Unknown'),
-            'detection_method': 'REPL_ID environment variable',
-            'features': [
-                'Built-in PostgreSQL database',
-                'Automatic HTTPS',
-                'Real-time collaboration',
-                'Package management',
-                'Secrets management'
-            ],
-            'limitations': [
-                'Resource limits apply',
-                'Always-on requires subscription',
-                'Storage limitations'
-            ],
-            'config_path': os.getenv('REPL_HOME', '/home/runner'),
-            'database_type': 'PostgreSQL (Managed)',
-            'environment_variables': {
-                'REPL_ID': os.getenv('REPL_ID'),
-                'REPL_SLUG': os.getenv('REPL_SLUG'),
-                'REPL_OWNER': os.getenv('REPL_OWNER')
-            }
-        }
-    
-    elif env_type == "databricks":
-        return {
-            **base_info,
-            'name': 'Databricks',
-            'status': '🔵 Active',
-            'version': os.getenv('DATABRICKS_RUNTIME_VERSION', 'Unknown'),
-            'detection_method': 'DATABRICKS_RUNTIME_VERSION environment variable',
-            'features': [
-                'Spark integration',
-                'Databricks SQL Warehouse',
-                'MLflow integration',
-                'Delta Lake support',
-                'Collaborative notebooks'
-            ],
-            'limitations': [
-                'Cluster startup time',
-                'Compute costs when running',
-                'Session timeouts'
-            ],
-            'config_path': '/databricks/driver',
-            'database_type': 'Databricks SQL',
-            'cluster_info': {
-                'cluster_id': os.getenv('DATABRICKS_CLUSTER_ID'),
-                'spark_version': os.getenv('SPARK_VERSION'),
-                'node_type': os.getenv('DATABRICKS_NODE_TYPE')
-            }
-        }
-    
-    elif env_type == "codespace":
-        return {
-            **base_info,
-            'name': 'GitHub Codespace',
-            'status': '🟢 Active',
-            'version': 'Latest',
-            'detection_method': 'CODESPACE_NAME environment variable',
-            'features': [
-                'VS Code in browser',
-                'GitHub integration',
-                'Port forwarding',
-                'Extensions support'
-            ],
-            'limitations': [
-                'Usage quotas apply',
-                'Automatic shutdown',
-                'Storage limitations'
-            ],
-            'config_path': '/workspaces',
-            'database_type': 'SQLite (default)'
-        }
-    
-    elif env_type == "gitpod":
-        return {
-            **base_info,
-            'name': 'Gitpod',
-            'status': '🟢 Active', 
-            'version': 'Latest',
-            'detection_method': 'GITPOD_WORKSPACE_ID environment variable',
-            'features': [
-                'VS Code or Theia',
-                'Git integration',
-                'Prebuilds support',
-                'Port forwarding'
-            ],
-            'limitations': [
-                'Workspace timeout',
-                'Storage limitations',
-                'Usage quotas'
-            ],
-            'config_path': '/workspace',
-            'database_type': 'SQLite (default)'
-        }
-    
-    else:  # local
-        return {
-            **base_info,
-            'name': 'Local Development',
-            'status': '🟡 Local',
-            'version': 'Custom',
-            'detection_method': 'Default (no cloud indicators)',
-            'features': [
-                'Full system access',
-                'Custom database setup',
-                'Development tools',
-                'No usage limits'
-            ],
-            'limitations': [
-                'Manual configuration required',
-                'No automatic scaling',
-                'Local network only'
-            ],
-            'config_path': os.getcwd(),
-            'database_type': 'PostgreSQL or SQLite'
-        }
+
+def _build_local_database_config() -> Dict[str, Any]:
+    """Database configuration for local and other environments."""
+    env = os.environ
+    
+    # Local or other - try PostgreSQL, fallback to SQLite
+    return {
+        'type': 'postgresql',
+        'host': env.get('PGHOST', 'localhost'),
+        'port': int(env.get('PGPORT', '5432')),
+        'database': env.get('PGDATABASE', 'azure_support'),
+        'username': env.get('PGUSER', 'postgres'),
+        'password': env.get('PGPASSWORD', ''),
+        'url': env.get('DATABASE_URL', ''),
+        'fallback_to_sqlite': True,
+        'managed': False
+    }
+
+# Environment type -> builder for its get_database_config result
+_DATABASE_CONFIG_BUILDERS = {
+    'replit': _build_replit_database_config,
+    'databricks': _build_databricks_database_config
+}
 
 def get_database_config(env_type: str) -> Dict[str, Any]:
     """
@@ -182,54 +288,11 @@ def get_database_config(env_type: str) -> Dict[str, Any]:
     Returns:
         Database configuration dictionary
     """
-    if env_type == "replit":
-        # Replit provides managed PostgreSQL
-        return {
-            'type': 'postgresql',
-            'host': os.getenv('PGHOST'),
-            'port': int(os.getenv('PGPORT', '5432')),
-            'database': os.getenv('PGDATABASE'),
-            'username': os.getenv('PGUSER'),
-            'password': os.getenv('PGPASSWORD'),
-            'url': os.getenv('DATABASE_URL'),
-            'ssl_mode': 'require',
-            'managed': True
-        }
-    
-    elif env_type == "databricks":
-        # Databricks SQL Warehouse
-        return {
-            'type': 'databricks_sql',
-            'server_hostname': os.getenv('DATABRICKS_SERVER_HOSTNAME'),
-            'http_path': os.getenv('DATABRICKS_HTTP_PATH'),
-            'access_token': os.getenv('DATABRICKS_ACCESS_TOKEN'),
-            'managed': True
-        }
-    
-    else:
-        # Local or other - try PostgreSQL, fallback to SQLite
-        return {
-            'type': 'postgresql',
-            'host': os.getenv('PGHOST', 'localhost'),
-            'port': int(os.getenv('PGPORT', '5432')),
-            'database': os.getenv('PGDATABASE', 'azure_support'),
-            'username': os.getenv('PGUSER', 'postgres'),
-            'password': os.getenv('PGPASSWORD', ''),
-            'url': os.getenv('DATABASE_URL', ''),
-            'fallback_to_sqlite': True,
-            'managed': False
-        }
+    return _DATABASE_CONFIG_BUILDERS.get(env_type, _build_local_database_config)()
 
-def get_required_packages(env_type: str) -> list:
-    """
-    Get list of required packages for the environment.
-    
-    Args:
-        env_type: Environment type
-        
-    Returns:
-        List of package names
-    """
+@functools.lru_cache(maxsize=8)
+def _required_packages(env_type: str) -> tuple:
+    """Package names for an environment type, built once per type."""
     base_packages = [
         'streamlit',
         'pandas',
@@ -250,7 +313,42 @@ def get_required_packages(env_type: str) -> list:
         # Replit usually has most packages available
         pass
     
-    return base_packages
+    return tuple(base_packages)
+
+def get_required_packages(env_type: str) -> list:
+    """
+    Get list of required packages for the environment.
+    
+    Args:
+        env_type: Environment type
+        
+    Returns:
+        List of package names
+    """
+    return list(_required_packages(env_type))
+
+def _replit_paths() -> Dict[str, str]:
+    """Path overrides for Replit, rooted at REPL_HOME."""
+    repl_home = os.environ.get('REPL_HOME', '/home/runner')
+    return {
+        'home': repl_home,
+        'data': os.path.join(repl_home, 'data'),
+        'logs': os.path.join(repl_home, 'logs')
+    }
+
+def _databricks_paths() -> Dict[str, str]:
+    """Path overrides for Databricks, where the working directory may be read-only."""
+    return {
+        'home': '/databricks/driver',
+        'data': '/tmp/azure_support_data',
+        'logs': '/tmp/azure_support_logs'
+    }
+
+# Environment type -> overrides applied on top of the default paths
+_PATH_OVERRIDES = {
+    'replit': _replit_paths,
+    'databricks': _databricks_paths
+}
 
 def setup_environment_paths(env_type: str) -> Dict[str, str]:
     """
@@ -262,27 +360,18 @@ def setup_environment_paths(env_type: str) -> Dict[str, str]:
     Returns:
         Dictionary of path configurations
     """
+    cwd = os.getcwd()
     paths = {
         'home': os.path.expanduser('~'),
-        'current': os.getcwd(),
-        'data': os.path.join(os.getcwd(), 'data'),
-        'logs': os.path.join(os.getcwd(), 'logs'),
-        'config': os.path.join(os.getcwd(), 'config')
+        'current': cwd,
+        'data': os.path.join(cwd, 'data'),
+        'logs': os.path.join(cwd, 'logs'),
+        'config': os.path.join(cwd, 'config')
     }
     
-    if env_type == "replit":
-        paths.update({
-            'home': os.getenv('REPL_HOME', '/home/runner'),
-            'data': os.path.join(os.getenv('REPL_HOME', '/home/runner'), 'data'),
-            'logs': os.path.join(os.getenv('REPL_HOME', '/home/runner'), 'logs')
-        })
-    
-    elif env_type == "databricks":
-        paths.update({
-            'home': '/databricks/driver',
-            'data': '/tmp/azure_support_data',
-            'logs': '/tmp/azure_support_logs'
-        })
+    overrides = _PATH_OVERRIDES.get(env_type)
+    if overrides:
+        paths.update(overrides())
     
     # Create directories if they don't exist
     for path_name, path_value in paths.items():
@@ -305,6 +394,8 @@ def check_environment_requirements(env_type: str) -> Dict[str, Any]:
     Returns:
         Dictionary with requirement check results
     """
+    env = os.environ
+    
     checks = {
         'python_version': {
             'required': '3.8+',
@@ -325,7 +416,7 @@ def check_environment_requirements(env_type: str) -> Dict[str, Any]:
     # Environment-specific checks
     if env_type == "replit":
         required_vars = ['PGHOST', 'PGDATABASE', 'PGUSER', 'PGPASSWORD']
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        missing_vars = [var for var in required_vars if not env.get(var)]
         
         checks['environment_variables'].update({
             'required': required_vars,
@@ -335,7 +426,7 @@ def check_environment_requirements(env_type: str) -> Dict[str, Any]:
     
     elif env_type == "databricks":
         required_vars = ['DATABRICKS_RUNTIME_VERSION']
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        missing_vars = [var for var in required_vars if not env.get(var)]
         
         checks['environment_variables'].update({
             'required': required_vars,
@@ -358,6 +449,8 @@ def get_environment_secrets() -> Dict[str, Optional[str]]:
     Returns:
         Dictionary of available secrets (values are masked)
     """
+    env = os.environ
+    
     secret_keys = [
         'DATABASE_URL',
         'PGPASSWORD', 
@@ -370,7 +463,7 @@ def get_environment_secrets() -> Dict[str, Optional[str]]:
     
     secrets = {}
     for key in secret_keys:
-        value = os.getenv(key)
+        value = env.get(key)
         if value:
             # Mask the value for security
             if len(value) > 8:
@@ -395,23 +488,16 @@ def is_development_mode() -> bool:
         detect_environment() == 'local'
     )
 
-def get_streamlit_config(env_type: str) -> Dict[str, Any]:
-    """
-    Get Streamlit configuration based on environment.
-    
-    Args:
-        env_type: Environment type
-        
-    Returns:
-        Streamlit configuration dictionary
-    """
-    config = {
+def _streamlit_config(**server_overrides) -> Dict[str, Any]:
+    """Base Streamlit configuration with environment-specific server settings applied."""
+    return {
         'server': {
             'headless': True,
             'address': '0.0.0.0',
             'port': 5000,
             'enableCORS': False,
-            'enableXsrfProtection': False
+            'enableXsrfProtection': False,
+            **server_overrides
         },
         'browser': {
             'gatherUsageStats': False,
@@ -419,18 +505,22 @@ def get_streamlit_config(env_type: str) -> Dict[str, Any]:
             'serverPort': 5000
         }
     }
+
+# Streamlit configuration per environment type, built once at import
+_STREAMLIT_CONFIGS = {
+    'replit': _streamlit_config(enableWebsocketCompression=True, runOnSave=True),
+    'databricks': _streamlit_config(enableWebsocketCompression=False, maxUploadSize=200),
+    'default': _streamlit_config()
+}
+
+def get_streamlit_config(env_type: str) -> Dict[str, Any]:
+    """
+    Get Streamlit configuration based on environment.
     
-    # Environment-specific adjustments
-    if env_type == "replit":
-        config['server'].update({
-            'enableWebsocketCompression': True,
-            'runOnSave': True
-        })
-    
-    elif env_type == "databricks":
-        config['server'].update({
-            'enableWebsocketCompression': False,
-            'maxUploadSize': 200
-        })
-    
-    return config
+    Args:
+        env_type: Environment type
+        
+    Returns:
+        Streamlit configuration dictionary (a copy the caller may modify)
+    """
+    return copy.deepcopy(_STREAMLIT_CONFIGS.get(env_type, _STREAMLIT_CONFIGS['default']))
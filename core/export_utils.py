@@ -3,23 +3,165 @@ Export utilities for reports and dashboards.
 Supports PDF and Excel export formats.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import numbers
+from datetime import datetime, date, time
 from typing import Dict, Any, List
 import io
+from collections import Counter
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Optional faster writer for Excel exports; openpyxl is used when it is missing
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Excel column width cap, in characters
+MAX_COLUMN_WIDTH = 50
+
+# PDF tables with more rows than this are laid out as LongTable
+LONG_TABLE_ROWS = 200
+
+def _column_widths(df: pd.DataFrame) -> np.ndarray:
+    """Width per column: longest header or value as text plus padding, capped at MAX_COLUMN_WIDTH."""
+    widths = np.array([len(str(column)) for column in df.columns], dtype=np.int64)
+    if len(df):
+        # Missing values are written as empty cells; all-missing columns give NaN (pandas 3 string dtype)
+        value_widths = [df.iloc[:, i].astype(str).str.len().fillna(0).max() for i in range(df.shape[1])]
+        widths = np.maximum(widths, np.asarray(value_widths, dtype=np.int64))
+    return np.minimum(widths + 2, MAX_COLUMN_WIDTH)
+
+# Cell value types both Excel writers accept as-is
+_EXCEL_SCALARS = (str, numbers.Number, datetime, date, time, type(None))
+
+def _excel_cell(value: Any) -> Any:
+    """Pass scalars through; write anything else (dicts, lists, ...) as its string form."""
+    return value if isinstance(value, _EXCEL_SCALARS) else str(value)
+
+def _excel_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Object-typed copy ready for cell writes.
+    
+    Missing values become None so they are written as empty cells,
+    timezone-aware datetimes keep their wall time (Excel has no time zones),
+    and non-scalar values such as resource tags are written as text.
+    """
+    tz_columns = [i for i, dtype in enumerate(df.dtypes) if isinstance(dtype, pd.DatetimeTZDtype)]
+    if tz_columns:
+        df = df.copy()
+        for i in tz_columns:
+            df.isetitem(i, df.iloc[:, i].dt.tz_localize(None))
+    
+    values = df.astype(object)
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            values.isetitem(i, values.iloc[:, i].map(_excel_cell))
+    # map() can infer a string dtype that turns None back into NaN, so blank missing values last
+    values = values.astype(object)
+    return values.where(values.notna(), None)
+
+def _write_excel_xlsxwriter(output: io.BytesIO, data: Dict[str, pd.DataFrame]):
+    """Write sheets with xlsxwriter, which writes plain cell data without building openpyxl cell objects."""
+    workbook = xlsxwriter.Workbook(output, {
+        'in_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    })
+    header_format = workbook.add_format({
+        'bold': True,
+        'font_color': 'white',
+        'bg_color': '#0078D4',
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+    
+    for sheet_name, df in data.items():
+        worksheet = workbook.add_worksheet(sheet_name)
+        
+        for i, width in enumerate(_column_widths(df)):
+            worksheet.set_column(i, i, int(width))
+        
+        worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+        for r, row in enumerate(_excel_values(df).itertuples(index=False, name=None), start=1):
+            worksheet.write_row(r, 0, row)
+    
+    workbook.close()
+
+def _write_excel_openpyxl(output: io.BytesIO, data: Dict[str, pd.DataFrame]):
+    """Write sheets with a write-only openpyxl workbook, which streams rows instead of keeping every cell."""
+    workbook = openpyxl.Workbook(write_only=True)
+    header_fill = PatternFill(start_color="0078D4", end_color="0078D4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+    header_alignment = Alignment(horizontal='center', vertical='center')
+    
+    for sheet_name, df in data.items():
+        worksheet = workbook.create_sheet(title=sheet_name)
+        
+        # Column widths must be set before the first row is written
+        for i, width in enumerate(_column_widths(df), start=1):
+            worksheet.column_dimensions[get_column_letter(i)].width = int(width)
+        
+        # Style header row
+        header = []
+        for column in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(column))
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header.append(cell)
+        worksheet.append(header)
+        
+        for row in dataframe_to_rows(_excel_values(df), index=False, header=False):
+            worksheet.append(row)
+    
+    workbook.save(output)
+
 class ExportUtils:
     """Utility class for exporting data to various formats."""
     
+    # PDF styles, built once rather than on every export
+    _STYLES = getSampleStyleSheet()
+    
+    _TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#0078D4'),
+        alignment=TA_CENTER,
+        spaceAfter=20
+    )
+    
+    _HEADING_STYLE = ParagraphStyle(
+        'CustomHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#0078D4'),
+        spaceAfter=10
+    )
+    
+    _TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0078D4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ])
+    
     @staticmethod
     def export_to_excel(data: Dict[str, pd.DataFrame], title: str = "Azure Report") -> bytes:
         """
@@ -34,38 +176,11 @@ class ExportUtils:
         """
         output = io.BytesIO()
         
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            for sheet_name, df in data.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Format the worksheet
-                worksheet = writer.sheets[sheet_name]
-                
-                # Style header row
-                header_fill = PatternFill(start_color="0078D4", end_color="0078D4", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF")
-                
-                for cell in worksheet[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+        if xlsxwriter:
+            _write_excel_xlsxwriter(output, data)
+        else:
+            _write_excel_openpyxl(output, data)
         
-        output.seek(0)
         return output.getvalue()
     
     @staticmethod
@@ -84,24 +199,9 @@ class ExportUtils:
         doc = SimpleDocTemplate(output, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
         story = []
         
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#0078D4'),
-            alignment=TA_CENTER,
-            spaceAfter=20
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#0078D4'),
-            spaceAfter=10
-        )
+        styles = ExportUtils._STYLES
+        title_style = ExportUtils._TITLE_STYLE
+        heading_style = ExportUtils._HEADING_STYLE
         
         # Title
         story.append(Paragraph(title, title_style))
@@ -113,21 +213,14 @@ class ExportUtils:
             story.append(Paragraph(section_title, heading_style))
             
             if isinstance(section_data, pd.DataFrame):
-                # Convert DataFrame to table
-                table_data = [section_data.columns.tolist()] + section_data.values.tolist()
+                # Convert DataFrame to table; the rows stay numpy object arrays
+                rows = section_data.to_numpy(dtype=object)
+                table_data = [section_data.columns.tolist(), *rows]
                 
-                table = Table(table_data, repeatRows=1)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0078D4')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ]))
+                # LongTable sizes columns from the first rows only, which keeps long tables fast to lay out
+                table_cls = LongTable if len(rows) > LONG_TABLE_ROWS else Table
+                table = table_cls(table_data, repeatRows=1)
+                table.setStyle(ExportUtils._TABLE_STYLE)
                 
                 story.append(table)
             
@@ -155,13 +248,17 @@ class ExportUtils:
     @staticmethod
     def create_incident_report(incidents: List[Dict[str, Any]]) -> bytes:
         """Create a detailed incident report in PDF format."""
-        # Convert incidents to DataFrame
-        df_incidents = pd.DataFrame(incidents)
+        # sqlite3.Row (as returned by execute_query) has no .get() and pandas reads it as a plain tuple
+        incidents = [i if isinstance(i, dict) else dict(i) for i in incidents]
         
-        # Summary statistics
+        # Summary statistics in a single pass
+        status_counts = Counter(i.get('status') for i in incidents)
         total_incidents = len(incidents)
-        open_incidents = len([i for i in incidents if i.get('status') == 'Open'])
-        resolved_incidents = len([i for i in incidents if i.get('status') == 'Resolved'])
+        open_incidents = status_counts.get('Open', 0)
+        resolved_incidents = status_counts.get('Resolved', 0)
+        
+        # Only the reported columns are built into the DataFrame
+        details = pd.DataFrame(incidents, columns=['incident_id', 'title', 'status', 'priority', 'assignee'])
         
         data = {
             'Summary': {
@@ -170,7 +267,7 @@ class ExportUtils:
                 'Resolved Incidents': resolved_incidents,
                 'Resolution Rate': f"{(resolved_incidents/total_incidents*100):.1f}%" if total_incidents > 0 else "0%"
             },
-            'Incident Details': df_incidents[['incident_id', 'title', 'status', 'priority', 'assignee']] if not df_incidents.empty else pd.DataFrame()
+            'Incident Details': details
         }
         
         return ExportUtils.export_to_pdf(data, "Incident Report")
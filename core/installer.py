@@ -8,6 +8,7 @@ import sys
 import subprocess
 import importlib
 import logging
+import functools
 from typing import List, Dict, Any, Optional, Tuple
 
 class DependencyInstaller:
@@ -333,6 +334,44 @@ def check_and_install_dependencies(environment: str, required_packages: Optional
     installer = DependencyInstaller(environment)
     return installer.check_and_install_dependencies(required_packages)
 
+# Marker written after a successful check so process restarts can skip probing
+DEPS_SENTINEL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.deps_installed')
+
+@functools.lru_cache(maxsize=1)
+def ensure_dependencies(environment: str) -> bool:
+    """
+    Check and install dependencies at most once per process.
+    
+    A sentinel file recording the environment and Python version is written
+    after a successful run, so later processes skip the probe entirely.
+    Delete the sentinel to force a re-check.
+    
+    Args:
+        environment: Environment type (replit, databricks, local)
+        
+    Returns:
+        True if dependencies are known to be available, False otherwise
+    """
+    marker = f"{environment} {sys.version_info.major}.{sys.version_info.minor}"
+    
+    try:
+        with open(DEPS_SENTINEL, 'r') as f:
+            if f.read().strip() == marker:
+                return True
+    except OSError:
+        pass
+    
+    results = check_and_install_dependencies(environment)
+    
+    if results['success']:
+        try:
+            with open(DEPS_SENTINEL, 'w') as f:
+                f.write(marker)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not write dependency sentinel: {e}")
+    
+    return results['success']
+
 def install_missing_package(package_name: str, environment: str) -> bool:
     """
     Install a single missing package.
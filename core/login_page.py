@@ -4,8 +4,8 @@ Login page component for Streamlit app.
 
 import streamlit as st
 from typing import Optional, Dict, Any
-from user_auth import UserAuth
-from db_manager import DatabaseManager
+from .user_auth import UserAuth
+from .db_manager import DatabaseManager
 
 def show_login_page(db_manager: DatabaseManager) -> Optional[Dict[str, Any]]:
     """
@@ -131,7 +131,7 @@ def show_user_menu():
             
             if st.button("🚪 Sign Out", use_container_width=True):
                 # Clear session state
-                for key in ['user', 'authenticated', 'azure_client', 'db_manager']:
+                for key in ['user', 'authenticated', 'azure_client']:
                     if key in st.session_state:
                         del st.session_state[key]
                 st.rerun()
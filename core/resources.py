@@ -0,0 +1,68 @@
+"""
+Process-wide shared resources for the Streamlit application.
+Configuration and the database manager are created once and shared by every session.
+"""
+
+import json
+import streamlit as st
+from typing import Dict, Any, List, Optional
+
+from .config_loader import load_config
+from .db_manager import DatabaseManager
+
+@st.cache_resource
+def cached_config() -> Dict[str, Any]:
+    """Load configuration once per process instead of on every session."""
+    return load_config()
+
+@st.cache_resource
+def _shared_db(cfg_hash: str, _config: Dict[str, Any]) -> DatabaseManager:
+    """
+    Create the shared database manager for a given database configuration.
+
+    Raises on failure so that a failed connection is not cached.
+    """
+    db_manager = DatabaseManager(_config)
+    if not db_manager.initialize():
+        raise ConnectionError("Database initialization failed")
+    return db_manager
+
+def _db_config_hash(config: Dict[str, Any]) -> str:
+    """Stable cache key for the database section of the configuration."""
+    return json.dumps(config.get('database', {}), sort_keys=True, default=str)
+
+def get_db_manager(config: Optional[Dict[str, Any]] = None) -> Optional[DatabaseManager]:
+    """
+    Get the database manager shared by all sessions.
+
+    Args:
+        config: Configuration to connect with (defaults to the session or process config)
+
+    Returns:
+        Initialized DatabaseManager, or None if the database is unavailable
+    """
+    if config is None:
+        config = st.session_state.get('config') or cached_config()
+
+    try:
+        return _shared_db(_db_config_hash(config), config)
+    except ConnectionError:
+        return None
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_incidents(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get incidents from the shared database, caching results for 5 minutes.
+
+    Call cached_incidents.clear() after creating or updating an incident.
+
+    Args:
+        limit: Maximum number of incidents (newest first)
+
+    Returns:
+        List of incident dictionaries (empty if the database is unavailable)
+    """
+    db_manager = get_db_manager()
+    if not db_manager:
+        return []
+    return db_manager.get_incidents(limit=limit)
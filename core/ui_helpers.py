@@ -37,12 +37,15 @@ def setup_page_config():
         }
     )
 
-def display_environment_indicator(environment: str):
+def get_environment_indicator_html(environment: str) -> str:
     """
-    Display environment indicator in the sidebar.
+    Build the sidebar environment indicator markup.
     
     Args:
         environment: Environment type (replit, databricks, local)
+        
+    Returns:
+        HTML string for the indicator
     """
     env_colors = {
         'replit': '🟢',
@@ -63,8 +66,7 @@ def display_environment_indicator(environment: str):
     color = env_colors.get(environment, '⚪')
     name = env_names.get(environment, environment.title())
     
-    st.sidebar.markdown(
-        f"""
+    return f"""
         <div style='text-align: center; padding: 10px; margin-bottom: 20px; 
                     background-color: #f0f2f6; border-radius: 10px;'>
             <h3 style='margin: 0; color: #0078D4;'>{color} {name}</h3>
@@ -72,7 +74,18 @@ def display_environment_indicator(environment: str):
                 Environment Active
             </p>
         </div>
-        """,
+        """
+
+def display_environment_indicator(environment: str, indicator_html: Optional[str] = None):
+    """
+    Display environment indicator in the sidebar.
+    
+    Args:
+        environment: Environment type (replit, databricks, local)
+        indicator_html: Pre-rendered markup from get_environment_indicator_html
+    """
+    st.sidebar.markdown(
+        indicator_html or get_environment_indicator_html(environment),
         unsafe_allow_html=True
     )
 
@@ -7,7 +7,7 @@ import hashlib
 import secrets
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-from db_manager import DatabaseManager
+from .db_manager import DatabaseManager
 
 class UserAuth:
     """
@@ -106,7 +106,7 @@ class UserAuth:
         else:
             query = "SELECT * FROM users WHERE username = ?"
         
-        results = self.db_manager.execute_query(query, (username,))
+        results = self.db_manager.execute_query(query, (username,), _to_dict=True)
         
         if not results:
             return None
@@ -153,7 +153,7 @@ class UserAuth:
     def get_all_users(self) -> List[Dict[str, Any]]:
         """Get all users (admin only)."""
         query = "SELECT username, email, role, created_at, last_login FROM users ORDER BY created_at DESC"
-        return self.db_manager.execute_query(query)
+        return self.db_manager.execute_query(query, _to_dict=True)
     
     def update_user_role(self, username: str, new_role: str) -> bool:
         """Update user role (admin only)."""
@@ -4,16 +4,9 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import sys
-import os
 
-# Add core directory to path - use absolute path
-core_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'core')
-if core_path not in sys.path:
-    sys.path.insert(0, core_path)
-
-from azure_client_factory import create_azure_client
-from ui_helpers import setup_page_config, show_notification
+from core.azure_client_factory import create_azure_client
+from core.ui_helpers import setup_page_config, show_notification
 
 def main():
     setup_page_config()
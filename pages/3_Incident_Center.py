@@ -3,17 +3,10 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 from datetime import datetime, timedelta
-import sys
-import os
 
-# Add core directory to path - use absolute path
-core_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'core')
-if core_path not in sys.path:
-    sys.path.insert(0, core_path)
-
-from db_manager import DatabaseManager
-from ui_helpers import setup_page_config, show_notification
-from export_utils import ExportUtils
+from core.resources import get_db_manager, cached_incidents
+from core.ui_helpers import setup_page_config, show_notification
+from core.export_utils import ExportUtils
 
 def main():
     setup_page_config()
@@ -21,12 +14,12 @@ def main():
     st.title("🚨 Incident & Support Center")
     st.markdown("Log, track, and resolve Azure service incidents with comprehensive ticket management.")
     
-    # Get database manager from session state
-    db_manager = st.session_state.get('db_manager', None)
+    # Get the shared database manager (only if the app connected successfully)
+    db_manager = get_db_manager() if st.session_state.get('db_connected') else None
     
     # Get real incident counts from database (or use empty list if no DB)
     if db_manager:
-        all_incidents = db_manager.get_incidents()
+        all_incidents = cached_incidents()
     else:
         all_incidents = []
         st.info("📝 Database not available. Incident tracking is disabled in demo mode.")
@@ -80,8 +73,8 @@ def main():
         with col3:
             search_term = st.text_input("🔍 Search incidents", placeholder="Search by title or ID...")
         
-        # Get incidents from database
-        db_incidents = db_manager.get_incidents(limit=100)
+        # Get incidents from database (cached; cleared whenever an incident is saved)
+        db_incidents = cached_incidents(limit=100)
         
         if db_incidents:
             incidents = []
@@ -207,6 +200,7 @@ def main():
                         if st.button("🔄 Save Status"):
                             if db_manager:
                                 if db_manager.update_incident(selected_incident, {'status': new_status}):
+                                    cached_incidents.clear()
                                     show_notification("success", f"Status updated to {new_status}")
                                     st.rerun()
                                 else:
@@ -282,6 +276,7 @@ def main():
                     # Save to database
                     if db_manager:
                         if db_manager.create_incident(incident_data):
+                            cached_incidents.clear()
                             show_notification("success", f"Incident {new_id} created successfully!")
                             
                             # Display created incident summary
@@ -4,15 +4,10 @@ from datetime import datetime
 import sys
 import os
 
-# Add core directory to path - use absolute path
-core_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'core')
-if core_path not in sys.path:
-    sys.path.insert(0, core_path)
-
-from config_loader import load_config, save_config
-from db_manager import DatabaseManager
-from env_utils import detect_environment, get_environment_info
-from ui_helpers import setup_page_config, show_notification
+from core.config_loader import load_config, save_config
+from core.resources import get_db_manager
+from core.env_utils import detect_environment, get_environment_info
+from core.ui_helpers import setup_page_config, show_notification
 
 def main():
     setup_page_config()
@@ -98,11 +93,8 @@ def main():
     with tab2:
         st.subheader("Database Configuration")
         
-        # Initialize database manager
-        if 'config' in st.session_state:
-            db_manager = DatabaseManager(st.session_state.config)
-        else:
-            db_manager = None
+        # Get the shared database manager (only if the app connected successfully)
+        db_manager = get_db_manager() if st.session_state.get('db_connected') else None
         
         # Database status
         col1, col2, col3 = st.columns(3)
@@ -195,7 +187,7 @@ SSL Mode: require
             if st.button("🔄 Initialize Schema"):
                 with st.spinner("Initializing database schema..."):
                     if db_manager:
-                        if db_manager.initialize():
+                        if db_manager.ensure_schema():
                             show_notification("success", "Database schema initialized!")
                         else:
                             show_notification("error", "Failed to initialize schema")
@@ -0,0 +1,47 @@
+"""
+Tests for the PostgreSQL connection pool in DatabaseManager.
+Needs a disposable PostgreSQL database: set TEST_DATABASE_URL to run them.
+"""
+
+import os
+import unittest
+import uuid
+from contextlib import ExitStack
+
+from core.db_manager import DatabaseManager
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+
+@unittest.skipUnless(TEST_DATABASE_URL, "TEST_DATABASE_URL is not set")
+class PooledConnectionTests(unittest.TestCase):
+    """Prepared statements and pooled connections under concurrent checkouts."""
+
+    def setUp(self):
+        self.db = DatabaseManager({'database': {
+            'url': TEST_DATABASE_URL,
+            'pool_size': 2,
+            'max_overflow': 3,
+            'connect_attempts': 1
+        }})
+        self.assertTrue(self.db.initialize())
+        self.assertEqual(self.db.db_type, 'postgresql')
+
+        self.incident_id = f"TEST-{uuid.uuid4().hex[:12]}"
+        self.assertTrue(self.db.create_incident({'incident_id': self.incident_id, 'title': 'Pool test'}))
+
+    def tearDown(self):
+        self.db.execute_update("DELETE FROM incidents WHERE incident_id = %s", (self.incident_id,))
+        self.db.close()
+
+    def test_get_incidents_after_returning_more_than_minconn(self):
+        for _ in range(3):
+            # Hold every slot at once so overflow connections are opened, then returned and closed
+            with ExitStack() as stack:
+                conns = [stack.enter_context(self.db._conn()) for _ in range(5)]
+                self.assertEqual(len({id(conn) for conn in conns}), 5)
+
+            incidents = self.db.get_incidents()
+            self.assertIn(self.incident_id, [incident['incident_id'] for incident in incidents])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests for the Excel export helpers.
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import io
+import unittest
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from core import export_utils
+from core.export_utils import ExportUtils, _column_widths
+
+class ColumnWidthTests(unittest.TestCase):
+    """Column width sizing for Excel exports."""
+
+    def test_all_missing_column_uses_header_width(self):
+        df = pd.DataFrame({'assignee': [None, None], 'cost': [np.nan, np.nan], 'id': ['INC-1', 'INC-2']})
+
+        widths = _column_widths(df)
+
+        self.assertEqual(widths.tolist(), [len('assignee') + 2, len('cost') + 2, len('INC-1') + 2])
+
+    def test_export_with_all_missing_column(self):
+        df = pd.DataFrame({'incident_id': ['INC-1'], 'assignee': [None]})
+
+        workbook = openpyxl.load_workbook(io.BytesIO(ExportUtils.export_to_excel({'Incidents': df})))
+        rows = [[cell.value for cell in row] for row in workbook['Incidents'].iter_rows()]
+
+        self.assertEqual(rows, [['incident_id', 'assignee'], ['INC-1', None]])
+
+class NonScalarCellTests(unittest.TestCase):
+    """Dict and list cells (such as resource tags) are written as text by both writers."""
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'name': ['vm-001', 'vm-002'],
+            'tags': [{'env': 'prod'}, {}],
+            'zones': [['1', '2'], None]
+        })
+        self.expected = [
+            ['name', 'tags', 'zones'],
+            ['vm-001', "{'env': 'prod'}", "['1', '2']"],
+            ['vm-002', '{}', None]
+        ]
+
+    def _rows(self, write):
+        output = io.BytesIO()
+        write(output, {'Resources': self.df})
+        workbook = openpyxl.load_workbook(io.BytesIO(output.getvalue()))
+        return [[cell.value for cell in row] for row in workbook['Resources'].iter_rows()]
+
+    def test_openpyxl_writer(self):
+        self.assertEqual(self._rows(export_utils._write_excel_openpyxl), self.expected)
+
+    @unittest.skipUnless(export_utils.xlsxwriter, "xlsxwriter is not installed")
+    def test_xlsxwriter_writer(self):
+        self.assertEqual(self._rows(export_utils._write_excel_xlsxwriter), self.expected)
+
+if __name__ == '__main__':
+    unittest.main()